@@ -1,17 +1,37 @@
 import aiohttp
 import logging
-from typing import Optional, Dict, Any
+import re
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple
 import json
 from enum import Enum
 
+from ..utils.cache import SingleFlight
+
 class ContentType(Enum):
     REPLY = "reply"
     MARKET = "market"
     NEWS = "news"
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Response cache settings (seconds); market data goes stale quickly
+CACHE_MAX_ENTRIES = 256
+CACHE_TTL = {
+    ContentType.MARKET: 60.0,
+}
+DEFAULT_CACHE_TTL = 300.0
+
+_NORMALIZE_RE = re.compile(r"\W+")
+
+# Ollama's num_predict counts tokens; English averages about 4 characters per
+# token, so budget for 3 to rarely stop short of max_length characters
+CHARS_PER_TOKEN = 3
+
+# (content_type, max_length, normalized prompt)
+CacheKey = Tuple[ContentType, Optional[int], str]
+
 SYSTEM_PROMPT = """You are BeraBot 🐻, a friendly and knowledgeable assistant for the Berachain ecosystem. Your personality:
 
 Core Traits:
@@ -42,38 +62,110 @@ Response Guidelines:
 4. Show enthusiasm for community achievements
 5. Make technical concepts accessible to all users"""
 
+def _truncate(text: str, max_length: Optional[int]) -> str:
+    """Cut text to max_length characters, at the last word boundary if there is one"""
+    if not max_length or len(text) <= max_length:
+        return text
+    cut = text[:max_length]
+    if text[max_length].isspace():
+        return cut.rstrip()
+    boundary = cut.rfind(" ")
+    return cut[:boundary].rstrip() if boundary > 0 else cut
+
 class ResponseGenerator:
     def __init__(self, ollama_url: str = "http://localhost:11434"):
         self.ollama_url = ollama_url
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
+        # cache key -> (expires_at, response)
+        self._cache: "OrderedDict[CacheKey, Tuple[float, str]]" = OrderedDict()
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._flight = SingleFlight()
+        
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=20,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=75
+                )
+            )
+        return self._session
         
-    async def generate_response(self, content_type: ContentType, context: Optional[Dict] = None) -> str:
-        """Generate response using Ollama"""
+    async def close(self) -> None:
+        """Close the shared HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        
+    async def generate_response(
+        self,
+        content_type: ContentType,
+        context: Optional[Dict] = None,
+        max_length: Optional[int] = None
+    ) -> str:
+        """Generate response using Ollama, capped at max_length characters if given"""
         try:
-            return await self._generate_deepseek_response(content_type, context)
+            prompt = self._get_prompt_for_type(content_type, context)
+            key = (content_type, max_length, _NORMALIZE_RE.sub(" ", prompt.lower()).strip())
+            cached = self._get_cached(key)
+            if cached is not None:
+                return cached
+            
+            async def generate() -> str:
+                response = await self._generate_deepseek_response(prompt, max_length)
+                if response:
+                    self._set_cached(key, response, CACHE_TTL.get(content_type, DEFAULT_CACHE_TTL))
+                return response
+            
+            # Identical requests already in flight share one Ollama call
+            return await self._flight.do(key, generate)
         except Exception as e:
-            self.logger.error(f"Error generating response: {str(e)}")
+            self.logger.error("Error generating response: %s", e)
             return ""
             
-    async def _generate_deepseek_response(self, content_type: ContentType, context: Optional[Dict] = None) -> str:
+    def _get_cached(self, key: CacheKey) -> Optional[str]:
+        """Return a cached response if it has not expired"""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires_at, response = entry
+        if time.monotonic() >= expires_at:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return response
+        
+    def _set_cached(self, key: CacheKey, response: str, ttl: float) -> None:
+        """Store a response, evicting the least recently used entry when full"""
+        self._cache[key] = (time.monotonic() + ttl, response)
+        self._cache.move_to_end(key)
+        if len(self._cache) > CACHE_MAX_ENTRIES:
+            self._cache.popitem(last=False)
+            
+    async def _generate_deepseek_response(self, prompt: str, max_length: Optional[int] = None) -> str:
         """Generate response using Ollama with deepseek-r1:1.5b model"""
         try:
-            prompt = self._get_prompt_for_type(content_type, context)
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.ollama_url}/api/generate",
-                    json={
-                        "model": "deepseek-r1:1.5b",
-                        "prompt": prompt,
-                        "stream": False
-                    }
-                ) as response:
-                    if response.status != 200:
-                        raise Exception(f"Ollama API error: {response.status}")
-                    data = await response.json()
-                    return data.get("response", "")
+            payload: Dict[str, Any] = {
+                "model": "deepseek-r1:1.5b",
+                "prompt": prompt,
+                "stream": False
+            }
+            if max_length:
+                # Stop generation early instead of discarding the overflow
+                payload["options"] = {"num_predict": -(-max_length // CHARS_PER_TOKEN)}
+            session = await self._get_session()
+            async with session.post(
+                f"{self.ollama_url}/api/generate",
+                json=payload
+            ) as response:
+                if response.status != 200:
+                    raise Exception(f"Ollama API error: {response.status}")
+                data = await response.json()
+                return _truncate(data.get("response", ""), max_length)
         except Exception as e:
-            self.logger.error(f"Ollama API error: {str(e)}")
+            self.logger.error("Ollama API error: %s", e)
             return ""
             
     def _get_prompt_for_type(self, content_type: ContentType, context: Optional[Dict] = None) -> str:
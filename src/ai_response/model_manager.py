@@ -4,12 +4,10 @@ import logging
 import aiohttp
 from aiohttp import ClientTimeout
 import asyncio
+import random
 from typing import Optional, Dict, List
 from enum import Enum
-
-# Configure logging directly
-logger = logging.getLogger(__name__)
-logging.basicConfig(level=logging.INFO)
+from ..utils.logging_config import get_logger
 
 # Define debug categories
 class DebugCategory(Enum):
@@ -18,8 +16,13 @@ class DebugCategory(Enum):
     VALIDATION = "validation"
     CONFIG = "config"
 
+# Records default to the API category; an explicit extra= overrides it
+logger = get_logger(__name__, DebugCategory.API)
+
 MAX_RETRIES = 3
 RETRY_DELAY = 1  # seconds
+MAX_BACKOFF = 30  # seconds
+OLLAMA_MODEL = "deepseek-r1:1.5b"
 
 class ModelType(Enum):
     OLLAMA = "ollama"
@@ -131,6 +134,7 @@ class AIModelManager:
             "http://localhost:11434"
         )
         self._initialized = False
+        self._session: Optional[aiohttp.ClientSession] = None
 
     async def initialize(self) -> None:
         """Initialize the AI model manager"""
@@ -143,6 +147,52 @@ class AIModelManager:
                 extra={"category": DebugCategory.VALIDATION.value}
             )
         self._initialized = True
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=32,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=75
+                )
+            )
+        return self._session
+
+    @staticmethod
+    def _backoff_delay(attempt: int) -> float:
+        """Full-jitter exponential backoff capped at MAX_BACKOFF"""
+        return random.uniform(0, min(RETRY_DELAY * (1 << attempt), MAX_BACKOFF))
+
+    async def warmup(self) -> bool:
+        """Ask Ollama to load the model so the first real request is hot"""
+        try:
+            session = await self._get_session()
+            # A generate request without a prompt only loads the model
+            async with session.post(
+                f"{self.ollama_url}/api/generate",
+                json={"model": OLLAMA_MODEL},
+                timeout=ClientTimeout(total=120.0)
+            ) as response:
+                return response.status == 200
+        except Exception as e:
+            self.logger.warning(
+                "Model warmup failed: %s", e
+            )
+            return False
+
+    async def close(self) -> None:
+        """Close the shared HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        
+    async def __aenter__(self) -> "AIModelManager":
+        return self
+        
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
         
     async def generate_content(
         self,
@@ -188,8 +238,7 @@ class AIModelManager:
 请直接提供专业、详细的回答，不要包含<think>标签或思考过程。"""
 
             self.logger.debug(
-                f"Generating {content_type.value} content",
-                extra={"category": DebugCategory.API.value}
+                "Generating %s content", content_type.value
             )
             
             for attempt in range(retries):
@@ -200,25 +249,24 @@ class AIModelManager:
                     
                     if attempt < retries - 1:
                         self.logger.warning(
-                            f"Retrying content generation (attempt {attempt + 1}/{retries})",
-                            extra={"category": DebugCategory.API.value}
+                            "Retrying content generation (attempt %d/%d)",
+                            attempt + 1, retries
                         )
-                        await asyncio.sleep(RETRY_DELAY * (attempt + 1))
+                        await asyncio.sleep(self._backoff_delay(attempt))
                 except Exception as e:
                     if attempt < retries - 1:
                         self.logger.warning(
-                            f"Error in content generation (attempt {attempt + 1}/{retries}): {str(e)}",
-                            extra={"category": DebugCategory.API.value}
+                            "Error in content generation (attempt %d/%d): %s",
+                            attempt + 1, retries, e
                         )
-                        await asyncio.sleep(RETRY_DELAY * (attempt + 1))
+                        await asyncio.sleep(self._backoff_delay(attempt))
                     else:
                         raise
             return None
                 
         except Exception as e:
             self.logger.error(
-                f"Error generating content: {str(e)}",
-                extra={"category": DebugCategory.API.value}
+                "Error generating content: %s", e
             )
             return None
             
@@ -226,7 +274,7 @@ class AIModelManager:
         """生成AI响应内容"""
         try:
             # Ollama configuration
-            model = "deepseek-r1:1.5b"
+            model = OLLAMA_MODEL
             temp = float(os.getenv("MODEL_TEMPERATURE", "0.7"))
             
             # Prepare payload for Ollama API
@@ -241,77 +289,74 @@ class AIModelManager:
                 }
             }
             
-            self.logger.debug(
-                f"Using model: {model} with prompt: {prompt[:100]}...",
-                extra={
-                    "category": DebugCategory.API.value,
-                    "prompt_length": len(prompt)
-                }
-            )
-            
-            self.logger.debug(
-                "Sending request to Ollama API",
-                extra={
-                    "category": DebugCategory.API.value,
-                    "prompt_length": len(prompt),
-                    "max_length": max_length,
-                    "model": model
-                }
-            )
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "Using model: %s with prompt: %s...", model, prompt[:100],
+                    extra={
+                        "category": DebugCategory.API.value,
+                        "prompt_length": len(prompt)
+                    }
+                )
+                self.logger.debug(
+                    "Sending request to Ollama API",
+                    extra={
+                        "category": DebugCategory.API.value,
+                        "prompt_length": len(prompt),
+                        "max_length": max_length,
+                        "model": model
+                    }
+                )
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.ollama_url}/api/generate",
-                    json=payload,
-                    timeout=ClientTimeout(total=10.0)  # 10 second timeout
-                ) as response:
-                    if response.status == 200:
-                        try:
-                            result = await response.json()
-                            if (isinstance(result, dict) and
-                                    "response" in result and
-                                    isinstance(result["response"], str)):
-                                return result["response"][:max_length]
-                            elif (isinstance(result, dict) and
-                                  "message" in result and
-                                  isinstance(result["message"], dict) and
-                                  "content" in result["message"]):
-                                return result["message"]["content"][:max_length]
-                            else:
-                                self.logger.error(
-                                    "Invalid response format from Ollama API",
-                                    extra={
-                                        "category": DebugCategory.API.value,
-                                        "response": str(result)
-                                    }
-                                )
-                        except json.JSONDecodeError as e:
+            session = await self._get_session()
+            async with session.post(
+                f"{self.ollama_url}/api/generate",
+                json=payload,
+                timeout=ClientTimeout(total=10.0)  # 10 second timeout
+            ) as response:
+                if response.status == 200:
+                    try:
+                        result = await response.json()
+                        if (isinstance(result, dict) and
+                                "response" in result and
+                                isinstance(result["response"], str)):
+                            return result["response"][:max_length]
+                        elif (isinstance(result, dict) and
+                              "message" in result and
+                              isinstance(result["message"], dict) and
+                              "content" in result["message"]):
+                            return result["message"]["content"][:max_length]
+                        else:
                             self.logger.error(
-                                f"Failed to parse Ollama response: {str(e)}",
+                                "Invalid response format from Ollama API",
                                 extra={
                                     "category": DebugCategory.API.value,
-                                    "response": await response.text()
+                                    "response": str(result)
                                 }
                             )
-                    else:
+                    except json.JSONDecodeError as e:
                         self.logger.error(
-                            f"Ollama API error (status {response.status})",
+                            "Failed to parse Ollama response: %s", e,
                             extra={
                                 "category": DebugCategory.API.value,
                                 "response": await response.text()
                             }
                         )
-                    return None
-                    
+                else:
+                    self.logger.error(
+                        "Ollama API error (status %d)", response.status,
+                        extra={
+                            "category": DebugCategory.API.value,
+                            "response": await response.text()
+                        }
+                    )
+                return None
+                
         except asyncio.TimeoutError:
-            self.logger.error(
-                "Ollama API request timed out",
-                extra={"category": DebugCategory.API.value}
-            )
+            self.logger.error("Ollama API request timed out")
             return None
         except Exception as e:
             self.logger.error(
-                f"Unexpected error in Ollama API call: {str(e)}",
+                "Unexpected error in Ollama API call: %s", e,
                 extra={
                     "category": DebugCategory.API.value,
                     "error_type": type(e).__name__
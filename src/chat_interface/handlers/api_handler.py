@@ -330,6 +330,7 @@ analytics_collector: Optional[AnalyticsCollector] = None
 model_manager: Optional[AIModelManager] = None
 response_formatter: Optional[ResponseFormatter] = None
 chat_handler: Optional[ChatHandler] = None
+warmup_task: Optional[asyncio.Task] = None
 
 # Initialize FastAPI app
 app = FastAPI()
@@ -366,24 +367,25 @@ async def initialize_services():
         metrics=metrics,
         circuit_breaker=circuit_breaker
     )
-    await price_tracker.initialize()
-
     news_monitor = NewsMonitor(
         rate_limiter=rate_limiter,
         metrics=metrics,
         circuit_breaker=circuit_breaker
     )
-    await news_monitor.initialize()
-
     analytics_collector = AnalyticsCollector(
         rate_limiter=rate_limiter,
         metrics=metrics,
         circuit_breaker=circuit_breaker
     )
-    await analytics_collector.initialize()
-
     model_manager = AIModelManager()
-    await model_manager.initialize()
+
+    # Services are independent once the rate limiter is ready
+    await asyncio.gather(
+        price_tracker.initialize(),
+        news_monitor.initialize(),
+        analytics_collector.initialize(),
+        model_manager.initialize()
+    )
 
     return (
         price_tracker,
@@ -399,6 +401,7 @@ async def startup_event():
     """Initialize services on FastAPI startup"""
     global redis_client, price_tracker, news_monitor
     global analytics_collector, model_manager, response_formatter, chat_handler
+    global warmup_task
 
     # Initialize Redis first
     redis_client = await initialize_redis()
@@ -421,6 +424,18 @@ async def startup_event():
     ) = await initialize_services()
     chat_handler = await initialize_chat_handler()
 
+    # Load the model in the background so startup is not blocked on Ollama
+    warmup_task = asyncio.create_task(model_manager.warmup())
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release shared HTTP resources on FastAPI shutdown"""
+    if warmup_task and not warmup_task.done():
+        warmup_task.cancel()
+    if model_manager:
+        await model_manager.close()
+
 
 # Initialize chat handler after services are ready
 async def initialize_chat_handler():
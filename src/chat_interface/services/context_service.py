@@ -1,5 +1,5 @@
 import redis.asyncio
-from typing import List, Dict, Optional
+from typing import Iterable, List, Dict, Optional
 import json
 from redis.asyncio.client import Redis
 
@@ -70,13 +70,26 @@ class ContextManager:
 
     async def add_message(self, session_id: str, message: Dict):
         """添加新消息到上下文"""
+        await self.add_messages(session_id, [message])
+
+    async def add_messages(self, session_id: str, messages: Iterable[Dict]):
+        """批量添加消息到上下文，只读写一次 Redis
+
+        结果与逐条调用 add_message 相同
+        """
         context_key = f"chat:context:{session_id}"
         context = await self.get_context(session_id)
-        context.append(message)
+        max_messages = self.max_context_rounds * 2
+
+        for i, message in enumerate(messages):
+            if i:
+                # add_message 每次都会重新读取压缩后的上下文
+                context = self._compress_context(context)
+            context.append(message)
 
-        # 保持最近5轮对话
-        if len(context) > self.max_context_rounds * 2:
-            context = context[-self.max_context_rounds * 2:]
+            # 保持最近5轮对话
+            if len(context) > max_messages:
+                context = context[-max_messages:]
 
         await self.redis_client.setex(
             context_key,
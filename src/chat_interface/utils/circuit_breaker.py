@@ -37,6 +37,13 @@ class CircuitBreaker:
         self.last_failure_time: Optional[float] = None
         self.last_success_time: Optional[float] = None
 
+    def reset(self) -> None:
+        """将断路器恢复到初始的关闭状态"""
+        self.state = CircuitState.CLOSED
+        self.failure_count = 0
+        self.last_failure_time = None
+        self.last_success_time = None
+
     def _should_allow_request(self) -> bool:
         """检查是否允许请求通过"""
         if self.state == CircuitState.CLOSED:
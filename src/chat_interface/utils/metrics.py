@@ -35,6 +35,13 @@ class Metrics:
         """记录请求次数"""
         self.request_count[endpoint] = self.request_count.get(endpoint, 0) + 1
 
+    def reset(self) -> None:
+        """清空所有指标"""
+        self.api_latency.clear()
+        self.error_count.clear()
+        self.request_count.clear()
+        self._start_times.clear()
+
     def get_metrics(self) -> Dict[str, Any]:
         """获取所有指标"""
         return {
@@ -1,8 +1,24 @@
 import time
 import asyncio
+from uuid import uuid4
 import redis.asyncio
-from typing import Optional, cast
+from typing import Optional
 from redis.asyncio.client import Redis
+from redis.commands.core import AsyncScript
+
+# Trim the window, count it and record the request only if it is admitted,
+# all in one atomic round trip
+_RATE_LIMIT_SCRIPT = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, ARGV[1])
+local count = redis.call('ZCARD', KEYS[1])
+local allowed = 0
+if count < tonumber(ARGV[2]) then
+    redis.call('ZADD', KEYS[1], ARGV[3], ARGV[4])
+    allowed = 1
+end
+redis.call('EXPIRE', KEYS[1], ARGV[5])
+return allowed
+"""
 
 
 class RateLimiter:
@@ -11,6 +27,7 @@ class RateLimiter:
         redis_client: Optional[Redis] = None
     ):
         self._redis_client = redis_client
+        self._rate_limit_script: Optional[AsyncScript] = None
         # Default rate limits for different APIs
         self.limits = {
             "beratrail": 60,    # requests per minute
@@ -77,31 +94,34 @@ class RateLimiter:
     ) -> bool:
         """检查是否超出速率限制"""
         try:
-            current = int(time.time())
+            now = time.time()
             # Use API-specific limits if available, otherwise use provided or default values
             limit = limit or self.limits.get(key, self.default_limit)
             window = window or self.windows.get(key, self.default_window)
 
             key = f"rate_limit:{key}"
 
-            # Use Redis pipeline for atomic operations with timeout
-            async with self.redis_client.pipeline() as pipe:
-                # Remove old entries first
-                pipe.zremrangebyscore(key, 0, current - window)
-                # Get current count before adding new request
-                pipe.zcard(key)
-                # Add new request
-                pipe.zadd(key, {str(current): current})
-                pipe.expire(key, window)
-                # Execute pipeline with timeout
-                results = await asyncio.wait_for(
-                    pipe.execute(),
-                    timeout=5.0
+            # EVALSHA, falling back to loading the script on first use
+            if self._rate_limit_script is None:
+                self._rate_limit_script = self.redis_client.register_script(
+                    _RATE_LIMIT_SCRIPT
                 )
-
-            # Check count before new request was added
-            request_count = cast(int, results[1])
-            return request_count < limit
+            allowed = await asyncio.wait_for(
+                self._rate_limit_script(
+                    keys=[key],
+                    # Unique member so requests in the same second each count
+                    args=[
+                        now - window,
+                        limit,
+                        now,
+                        f"{time.time_ns()}-{uuid4().hex}",
+                        window
+                    ],
+                    client=self.redis_client
+                ),
+                timeout=5.0
+            )
+            return allowed == 1
         except (asyncio.TimeoutError, redis.RedisError) as e:
             raise RuntimeError(f"Rate limit check failed: {str(e)}")
         except Exception as e:
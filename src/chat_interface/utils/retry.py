@@ -1,5 +1,6 @@
 from functools import wraps
 import asyncio
+import random
 from typing import (
     TypeVar, Callable, Any, Tuple, Optional,
     Union, Coroutine, TypeAlias
@@ -14,7 +15,8 @@ def async_retry(
     retries: int = 3,
     delay: float = 1.0,
     backoff: float = 2.0,
-    exceptions: Optional[ExceptionTypes] = None
+    exceptions: Optional[ExceptionTypes] = None,
+    max_delay: float = 60.0
 ) -> Callable[[AsyncFunc], AsyncFunc]:
     """异步重试装饰器
 
@@ -23,6 +25,7 @@ def async_retry(
         delay: 初始延迟时间（秒）
         backoff: 延迟时间的倍数
         exceptions: 需要重试的异常类型，默认为所有异常
+        max_delay: 单次延迟上限（秒）
 
     Returns:
         装饰器函数
@@ -45,7 +48,10 @@ def async_retry(
                     retry_count += 1
                     if retry_count == retries:
                         raise e
-                    await asyncio.sleep(current_delay)
+                    # 全抖动，避免多个调用方同时重试
+                    await asyncio.sleep(
+                        random.uniform(0, min(current_delay, max_delay))
+                    )
                     current_delay *= backoff
             raise RuntimeError("Should not reach here")
         return wrapper  # type: ignore
@@ -49,4 +49,10 @@ async def main():
         raise
 
 if __name__ == "__main__":
+    # uvloop is optional and only available on Linux/macOS
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     asyncio.run(main())
@@ -1,15 +1,17 @@
+import asyncio
 import logging
 import requests
 from bs4 import BeautifulSoup, Tag as BeautifulSoupTag
 from datetime import datetime
 from typing import List, Dict, Optional
 
+from ..utils.cache import TTLCache
 from ..utils.templates import NEWS_UPDATE_TEMPLATE, BEAR_EMOJI
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+logger = logging.getLogger(__name__)
+
+NEWS_CACHE_TTL = 300.0  # seconds
+IDO_CACHE_TTL = 900.0  # seconds
 
 class NewsMonitor:
     def __init__(self):
@@ -18,10 +20,21 @@ class NewsMonitor:
         self.latest_news_cache = []
         self.latest_idos_cache = []
         self.last_update = None
+        self._news_cache = TTLCache(NEWS_CACHE_TTL)
+        self._ido_cache = TTLCache(IDO_CACHE_TTL)
         
     async def fetch_latest_news(self) -> List[Dict]:
+        news = await self._news_cache.get_or_set("news", self._fetch_latest_news)
+        # Failures aren't cached; serve the last good result until a retry works
+        return self.latest_news_cache if news is None else news
+        
+    async def fetch_upcoming_idos(self) -> List[Dict]:
+        idos = await self._ido_cache.get_or_set("idos", self._fetch_upcoming_idos)
+        return self.latest_idos_cache if idos is None else idos
+        
+    async def _fetch_latest_news(self) -> Optional[List[Dict]]:
         try:
-            response = requests.get(self.bera_home_url)
+            response = await asyncio.to_thread(requests.get, self.bera_home_url)
             soup = BeautifulSoup(response.text, 'html.parser')
             
             news_items = []
@@ -52,18 +65,18 @@ class NewsMonitor:
                                     'summary': summary
                                 })
                         except (AttributeError, TypeError) as e:
-                            logging.warning(f"Error parsing news item: {str(e)}")
+                            logger.warning("Error parsing news item: %s", e)
             
             self.latest_news_cache = news_items
             self.last_update = datetime.now()
             return news_items
         except Exception as e:
-            logging.error(f"Error fetching BeraHome news: {str(e)}")
-            return self.latest_news_cache
+            logger.error("Error fetching BeraHome news: %s", e)
+            return None
             
-    async def fetch_upcoming_idos(self) -> List[Dict]:
+    async def _fetch_upcoming_idos(self) -> Optional[List[Dict]]:
         try:
-            response = requests.get(self.ido_url)
+            response = await asyncio.to_thread(requests.get, self.ido_url)
             soup = BeautifulSoup(response.text, 'html.parser')
             
             ido_items = []
@@ -89,13 +102,13 @@ class NewsMonitor:
                                     'status': status
                                 })
                         except (AttributeError, TypeError) as e:
-                            logging.warning(f"Error parsing IDO item: {str(e)}")
+                            logger.warning("Error parsing IDO item: %s", e)
             
             self.latest_idos_cache = ido_items
             return ido_items
         except Exception as e:
-            logging.error(f"Error fetching upcoming IDOs: {str(e)}")
-            return self.latest_idos_cache
+            logger.error("Error fetching upcoming IDOs: %s", e)
+            return None
             
     def format_news_update(self, news_item: Dict) -> str:
         return NEWS_UPDATE_TEMPLATE.format(
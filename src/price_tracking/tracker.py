@@ -1,50 +1,60 @@
+import time
+import asyncio
 import requests
 from typing import Dict, Optional
-from datetime import datetime, timedelta
 
-from ..twitter_bot.twitter_client import TwitterClient
+from ..utils.cache import TTLCache
 from ..utils.logging_config import get_logger, DebugCategory
+from ..utils.templates import PRICE_UPDATE_TEMPLATE, BEAR_EMOJI
 
-BEAR_EMOJI = "🐻"
-PRICE_UPDATE_TEMPLATE = "{emoji} BERA: ${price} | Volume: ${volume} | {change_24h}% 24h"
+PRICE_UNAVAILABLE_REPORT = f"{BEAR_EMOJI} Price data unavailable"
+PRICE_CHANGE_WINDOW = 86400.0  # seconds
+PRICE_CACHE_TTL = 60.0  # seconds
 
 class PriceTracker:
     def __init__(self):
         self.logger = get_logger(__name__)
         self.base_url = "https://beratrail.io/api/v1"
         self.previous_price = None
-        self.last_update = None
+        # time.monotonic() of the last sample, immune to wall-clock jumps
+        self.last_update: Optional[float] = None
+        self._cache = TTLCache(PRICE_CACHE_TTL)
         
     async def get_price_data(self):
+        return await self._cache.get_or_set("bera", self._fetch_price_data)
+        
+    async def _fetch_price_data(self):
         try:
             self.logger.debug(
                 "Fetching BERA price data from beratrail.io",
                 extra={"category": DebugCategory.PRICE.value}
             )
             
-            response = requests.get(f"{self.base_url}/tokens/bera")
+            # requests is blocking; keep it off the event loop
+            response = await asyncio.to_thread(
+                requests.get, f"{self.base_url}/tokens/bera"
+            )
             data = response.json()
             
             self.logger.debug(
-                f"Raw API response: {data}",
+                "Raw API response: %s", data,
                 extra={"category": DebugCategory.PRICE.value}
             )
             
             current_price = float(data['price'])
-            current_time = datetime.now()
+            current_time = time.monotonic()
             
             self.logger.debug(
-                f"Price data received: price={current_price}, time={current_time}",
+                "Price data received: price=%s", current_price,
                 extra={"category": DebugCategory.PRICE.value}
             )
             
             price_change_24h = 0
-            if self.previous_price and self.last_update:
-                time_diff = current_time - self.last_update
-                if time_diff.total_seconds() >= 86400:
+            if self.previous_price and self.last_update is not None:
+                if current_time - self.last_update >= PRICE_CHANGE_WINDOW:
                     price_change_24h = ((current_price - self.previous_price) / self.previous_price) * 100
                     self.logger.debug(
-                        f"Calculated 24h price change: {price_change_24h}%",
+                        "Calculated 24h price change: %s%%", price_change_24h,
                         extra={"category": DebugCategory.PRICE.value}
                     )
             
@@ -58,7 +68,7 @@ class PriceTracker:
             }
             
             self.logger.debug(
-                f"Returning price data: {result}",
+                "Returning price data: %s", result,
                 extra={"category": DebugCategory.PRICE.value}
             )
             
@@ -72,7 +82,7 @@ class PriceTracker:
             
     def format_price_report(self, data: Dict) -> str:
         if not data:
-            return f"{BEAR_EMOJI} Price data unavailable"
+            return PRICE_UNAVAILABLE_REPORT
         
         volume = data['volume_24h']
         volume_str = f"${volume/1_000_000_000:.1f}B" if volume >= 1_000_000_000 else f"${volume/1_000_000:.1f}M"
@@ -1,9 +1,10 @@
-import logging
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Dict, List, Optional
 from ..utils.logging_config import get_logger, DebugCategory
 
+logger = get_logger(__name__, DebugCategory.ANALYTICS)
+
 @dataclass
 class TokenAnalytics:
     price: float
@@ -17,15 +18,14 @@ class TokenAnalytics:
     
 class AnalyticsCollector:
     def __init__(self):
-        self.logger = get_logger(__name__)
+        self.logger = logger
         self._analytics_cache: Dict[str, List[TokenAnalytics]] = {}
         self._cache_limit = 1000  # Store last 1000 data points per token
         
     async def collect_analytics(self, token_address: str) -> Optional[TokenAnalytics]:
         try:
             self.logger.debug(
-                f"Collecting analytics for {token_address}",
-                extra={"category": DebugCategory.ANALYTICS.value}
+                "Collecting analytics for %s", token_address
             )
             
             # Get current price data
@@ -35,8 +35,7 @@ class AnalyticsCollector:
             
             if not price_data:
                 self.logger.error(
-                    f"Failed to get price data for {token_address}",
-                    extra={"category": DebugCategory.ANALYTICS.value}
+                    "Failed to get price data for %s", token_address
                 )
                 return None
                 
@@ -62,29 +61,25 @@ class AnalyticsCollector:
                 self._analytics_cache[token_address] = self._analytics_cache[token_address][-self._cache_limit:]
             
             self.logger.debug(
-                f"Analytics collected successfully: {analytics}",
-                extra={"category": DebugCategory.ANALYTICS.value}
+                "Analytics collected successfully: %s", analytics
             )
             
             return analytics
             
         except Exception as e:
             self.logger.error(
-                f"Error collecting analytics: {str(e)}",
-                extra={"category": DebugCategory.ANALYTICS.value}
+                "Error collecting analytics: %s", e
             )
             return None
             
     def get_cached_analytics(self, token_address: str, limit: int = 100) -> List[TokenAnalytics]:
         try:
             self.logger.debug(
-                f"Retrieving cached analytics for {token_address}",
-                extra={"category": DebugCategory.ANALYTICS.value}
+                "Retrieving cached analytics for %s", token_address
             )
             return self._analytics_cache.get(token_address, [])[-limit:]
         except Exception as e:
             self.logger.error(
-                f"Error retrieving cached analytics: {str(e)}",
-                extra={"category": DebugCategory.ANALYTICS.value}
+                "Error retrieving cached analytics: %s", e
             )
             return []
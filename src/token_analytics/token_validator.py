@@ -1,9 +1,10 @@
 import re
-import logging
 from typing import Optional
 from dataclasses import dataclass
 from ..utils.logging_config import get_logger, DebugCategory
 
+logger = get_logger(__name__, DebugCategory.TOKEN)
+
 @dataclass
 class TokenMetadata:
     address: str
@@ -14,30 +15,27 @@ class TokenMetadata:
 
 class TokenValidator:
     def __init__(self):
-        self.logger = get_logger(__name__)
+        self.logger = logger
         
     def validate_address(self, address: str) -> bool:
         try:
             if not isinstance(address, str):
-                self.logger.debug("Invalid address type", extra={"category": DebugCategory.TOKEN.value})
+                self.logger.debug("Invalid address type")
                 return False
                 
             if not re.match(r'^0x[a-fA-F0-9]{40}$', address):
                 self.logger.debug(
-                    f"Invalid address format: {address}",
-                    extra={"category": DebugCategory.TOKEN.value}
+                    "Invalid address format: %s", address
                 )
                 return False
                 
             self.logger.debug(
-                f"Address validated successfully: {address}",
-                extra={"category": DebugCategory.TOKEN.value}
+                "Address validated successfully: %s", address
             )
             return True
         except Exception as e:
             self.logger.error(
-                f"Error validating address: {str(e)}",
-                extra={"category": DebugCategory.TOKEN.value}
+                "Error validating address: %s", e
             )
             return False
             
@@ -47,21 +45,18 @@ class TokenValidator:
                 return None
                 
             self.logger.debug(
-                f"Fetching metadata for address: {address}",
-                extra={"category": DebugCategory.TOKEN.value}
+                "Fetching metadata for address: %s", address
             )
             
             # TODO: Implement token metadata fetching from blockchain/API
             # For now, return None to indicate not implemented
             self.logger.info(
-                "Token metadata fetching not implemented yet",
-                extra={"category": DebugCategory.TOKEN.value}
+                "Token metadata fetching not implemented yet"
             )
             return None
             
         except Exception as e:
             self.logger.error(
-                f"Error getting token metadata: {str(e)}",
-                extra={"category": DebugCategory.TOKEN.value}
+                "Error getting token metadata: %s", e
             )
             return None
@@ -0,0 +1,73 @@
+import time
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+class SingleFlight:
+    """Collapse concurrent calls for the same key into one in-flight call"""
+    def __init__(self):
+        self._inflight: Dict[Hashable, "asyncio.Future[Any]"] = {}
+
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[T]]) -> T:
+        """Await factory() once per key; concurrent callers share its result"""
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(factory())
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so one cancelled caller does not cancel the shared call
+        return await asyncio.shield(future)
+
+class TTLCache:
+    """In-process cache whose entries expire after a fixed TTL"""
+    def __init__(self, ttl: float, max_entries: int = 128):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        # key -> (expires_at, value), expiry on the monotonic clock
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._flight = SingleFlight()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value for the cache TTL"""
+        if key not in self._entries and len(self._entries) >= self.max_entries:
+            # Evict the oldest insertion (dicts keep insertion order)
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def clear(self) -> None:
+        """Drop all cached entries"""
+        self._entries.clear()
+
+    async def get_or_set(
+        self,
+        key: Hashable,
+        factory: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Return the cached value or await factory() and cache its result
+
+        Concurrent misses for the same key share a single factory() call.
+        None results are not cached so failures are retried on the next call.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        async def load() -> T:
+            result = await factory()
+            if result is not None:
+                self.set(key, result)
+            return result
+
+        return await self._flight.do(key, load)
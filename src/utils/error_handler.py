@@ -1,12 +1,22 @@
-from typing import Optional, Tuple
+from typing import Awaitable, Callable, Dict, Optional, Tuple
 from .logging_config import get_logger, DebugCategory
-from .rate_limiter import RateLimitStrategy, RateLimit
+from .rate_limiter import RateLimitStrategy
 from .errors import RetryAction, RateLimitError, NetworkError, AuthenticationError
 
+logger = get_logger(__name__, DebugCategory.API)
+
+ErrorResult = Tuple[RetryAction, float]
+
 class ErrorHandler:
-    def __init__(self, rate_limit_strategy: RateLimitStrategy):
-        self.rate_limit_strategy = rate_limit_strategy
-        self.logger = get_logger(__name__)
+    def __init__(self, rate_limit_strategy: Optional[RateLimitStrategy] = None):
+        self.logger = logger
+        self.rate_limit_strategy = rate_limit_strategy or RateLimitStrategy()
+        # Exact-type lookup first; subclasses fall back to an MRO walk
+        self._dispatch: Dict[type, Callable[[Exception, str, int], Awaitable[ErrorResult]]] = {
+            RateLimitError: self._handle_rate_limit,
+            NetworkError: self._handle_network,
+            AuthenticationError: self._handle_auth,
+        }
         
     async def handle_error(
         self,
@@ -23,41 +33,61 @@ class ErrorHandler:
             
         Returns:
             tuple[RetryAction, float]: Action to take and wait time in seconds
+                (0.0 when the action does not involve waiting)
         """
-        if isinstance(error, RateLimitError):
-            try:
-                wait_time = await self.rate_limit_strategy.handle_rate_limit(
-                    retry_count
-                )
-                self.logger.warning(
-                    f"Rate limit hit in {context}, waiting {wait_time}s",
-                    extra={"category": DebugCategory.API.value}
-                )
-                return RetryAction.WAIT_AND_RETRY, wait_time
-            except RateLimitError:
-                self.logger.error(
-                    f"Max retries exceeded in {context}",
-                    extra={"category": DebugCategory.API.value}
-                )
-                return RetryAction.ABORT, 0
+        handler = self._dispatch.get(type(error))
+        if handler is None:
+            for error_type in type(error).__mro__[1:]:
+                handler = self._dispatch.get(error_type)
+                if handler is not None:
+                    break
+        if handler is not None:
+            return await handler(error, context, retry_count)
             
-        if isinstance(error, NetworkError):
-            self.logger.error(
-                f"Network error in {context}: {str(error)}",
-                extra={"category": DebugCategory.API.value}
+        # Unknown errors
+        logger.error(
+            "Unexpected error in %s: %s", context, error.__class__.__name__
+        )
+        return RetryAction.ABORT, 0.0
+        
+    async def _handle_rate_limit(
+        self,
+        error: Exception,
+        context: str,
+        retry_count: int
+    ) -> ErrorResult:
+        try:
+            wait_time = await self.rate_limit_strategy.handle_rate_limit(
+                retry_count
             )
-            return RetryAction.RETRY_IMMEDIATELY, 0
-            
-        if isinstance(error, AuthenticationError):
-            self.logger.error(
-                f"Authentication error in {context}",
-                extra={"category": DebugCategory.API.value}
+            logger.warning(
+                "Rate limit hit in %s, waiting %ss", context, wait_time
+            )
+            return RetryAction.WAIT_AND_RETRY, wait_time
+        except RateLimitError:
+            logger.error(
+                "Max retries exceeded in %s", context
             )
-            return RetryAction.ABORT, 0
+            return RetryAction.ABORT, 0.0
             
-        # Unknown errors
-        self.logger.error(
-            f"Unexpected error in {context}: {error.__class__.__name__}",
-            extra={"category": DebugCategory.API.value}
+    async def _handle_network(
+        self,
+        error: Exception,
+        context: str,
+        retry_count: int
+    ) -> ErrorResult:
+        logger.error(
+            "Network error in %s: %s", context, error
+        )
+        return RetryAction.RETRY_IMMEDIATELY, 0.0
+        
+    async def _handle_auth(
+        self,
+        error: Exception,
+        context: str,
+        retry_count: int
+    ) -> ErrorResult:
+        logger.error(
+            "Authentication error in %s", context
         )
-        return RetryAction.ABORT, 0
+        return RetryAction.ABORT, 0.0
@@ -1,9 +1,29 @@
+import atexit
 import logging
+import logging.handlers
+import os
+import queue
 import sys
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Union
 from enum import Enum
 from datetime import datetime
 
+def _parse_level(value: str) -> int:
+    """Parse a level name such as INFO or a number such as 20; unknown values give 0"""
+    value = value.strip()
+    if value.isdigit():
+        return int(value)
+    level = logging.getLevelName(value.upper())
+    if isinstance(level, int):
+        return level
+    logging.getLogger(__name__).warning(
+        "Unknown BERA_MAX_LOG_LEVEL %r, keeping all log levels", value
+    )
+    return logging.NOTSET
+
+# Records below this level are dropped at the call site (0 keeps everything)
+MAX_LOG_LEVEL = _parse_level(os.getenv("BERA_MAX_LOG_LEVEL", "0"))
+
 class LogLevel(Enum):
     DEBUG = logging.DEBUG
     INFO = logging.INFO
@@ -21,15 +41,36 @@ class CategoryFilter(logging.Filter):
     def __init__(self, debug_categories: Optional[list[DebugCategory]] = None):
         super().__init__()
         self.debug_categories = debug_categories or []
+        self._allowed = frozenset(cat.value for cat in self.debug_categories)
         
     def filter(self, record: logging.LogRecord) -> bool:
-        if not hasattr(record, 'category'):
-            setattr(record, 'category', 'general')
-        return not self.debug_categories or getattr(record, 'category') in [cat.value for cat in self.debug_categories]
+        category = getattr(record, 'category', None)
+        if category is None:
+            # The formatter references %(category)s, so records need one
+            category = 'general'
+            setattr(record, 'category', category)
+        return not self._allowed or category in self._allowed
+
+# Background listener that drains queued records to the real handlers
+_listener: Optional[logging.handlers.QueueListener] = None
+
+def _stop_listener() -> None:
+    """Flush queued records, stop the listener thread and close its handlers"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+atexit.register(_stop_listener)
 
 def setup_logging(debug_categories: Optional[list[DebugCategory]] = None, log_file: str = 'berabot.log') -> None:
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.DEBUG if debug_categories else logging.INFO)
+    if MAX_LOG_LEVEL > logging.NOTSET:
+        # Checked by isEnabledFor before any record or message is built
+        logging.disable(MAX_LOG_LEVEL - 1)
     
     formatter = logging.Formatter(
         '%(asctime)s - %(name)s - [%(category)s] - %(levelname)s - %(message)s',
@@ -48,8 +89,34 @@ def setup_logging(debug_categories: Optional[list[DebugCategory]] = None, log_fi
     file_handler.setFormatter(formatter)
     file_handler.addFilter(category_filter)
     
-    root_logger.addHandler(console_handler)
-    root_logger.addHandler(file_handler)
+    # Log calls only enqueue; console and file I/O happen on the listener thread
+    global _listener
+    if _listener is not None:
+        # Replace the previous setup instead of stacking a second queue
+        _stop_listener()
+        for handler in list(root_logger.handlers):
+            if isinstance(handler, logging.handlers.QueueHandler):
+                root_logger.removeHandler(handler)
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _listener = logging.handlers.QueueListener(
+        log_queue,
+        console_handler,
+        file_handler,
+        respect_handler_level=True
+    )
+    _listener.start()
+
+class CategoryAdapter(logging.LoggerAdapter):
+    """Logger bound to one debug category; an explicit extra= still wins"""
+    def process(self, msg: Any, kwargs: Dict[str, Any]) -> tuple[Any, Dict[str, Any]]:
+        kwargs.setdefault('extra', self.extra)
+        return msg, kwargs
 
-def get_logger(name: str) -> logging.Logger:
-    return logging.getLogger(name)
+def get_logger(
+    name: str,
+    category: Optional[DebugCategory] = None
+) -> Union[logging.Logger, CategoryAdapter]:
+    if category is None:
+        return logging.getLogger(name)
+    return CategoryAdapter(logging.getLogger(name), {"category": category.value})
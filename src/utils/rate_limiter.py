@@ -1,14 +1,21 @@
 import time
+import random
 import asyncio
-import logging
-from typing import Dict, List, Optional
+from collections import defaultdict, deque
+from typing import DefaultDict, Deque, Dict, Optional, Tuple
 from dataclasses import dataclass
-from datetime import datetime, timedelta
 from .logging_config import get_logger, DebugCategory
 from .errors import RateLimitError
 
-@dataclass
+logger = get_logger(__name__, DebugCategory.API)
+
+# Window bookkeeping uses the monotonic clock so wall-clock jumps don't skew it
+_now = time.monotonic
+_EXPIRY_SLACK = 0.01
+
+@dataclass(frozen=True, slots=True)
 class RateLimit:
+    """Rate limit settings; reset_time is wall-clock, as sent by the API"""
     max_requests: int
     time_window: int
     remaining: int
@@ -17,26 +24,32 @@ class RateLimit:
 class RateLimitStrategy:
     def __init__(self, max_retries: int = 3):
         self.max_retries = max_retries
-        self.logger = get_logger(__name__)
+        self.logger = logger
         
     async def handle_rate_limit(
         self,
         retry_count: int,
         retry_after: Optional[int] = None
     ) -> float:
-        """Calculate wait time using exponential backoff"""
+        """Calculate wait time using exponential backoff with decorrelated jitter"""
         if retry_count >= self.max_retries:
             raise RateLimitError("Max retries exceeded")
             
         base_delay = retry_after or 60
-        wait_time = base_delay * (2 ** retry_count)
+        # Never below base_delay, spread so concurrent callers don't retry together
+        wait_time = random.uniform(base_delay, base_delay * 3 * (1 << retry_count))
         
         return min(wait_time, 3600)  # Cap at 1 hour
 
 class RateLimiter:
-    def __init__(self, default_max_requests: int = 25, default_window: int = 7200):
-        self.logger = get_logger(__name__)
-        self.strategy = RateLimitStrategy()
+    def __init__(
+        self,
+        default_max_requests: int = 25,
+        default_window: int = 7200,
+        strategy: Optional[RateLimitStrategy] = None
+    ):
+        self.logger = logger
+        self.strategy = strategy or RateLimitStrategy()
         self.default_limit = RateLimit(
             max_requests=default_max_requests,
             time_window=default_window,
@@ -44,39 +57,89 @@ class RateLimiter:
             reset_time=time.time() + default_window
         )
         self.endpoints: Dict[str, RateLimit] = {}
-        self.requests: List[float] = []
-        self.retry_counts: Dict[str, int] = {}
+        # Request timestamps per limited endpoint (None: default), oldest first
+        self.requests: Dict[Optional[str], Deque[float]] = defaultdict(deque)
+        # Consecutive waits per endpoint; cleared once capacity frees up
+        self.retry_counts: DefaultDict[Optional[str], int] = defaultdict(int)
+        # Serializes callers that have to wait for capacity on an endpoint
+        self._waiters: DefaultDict[Optional[str], asyncio.Lock] = defaultdict(asyncio.Lock)
+        # Last (remaining, reset, limit) header values applied per endpoint
+        self._last_headers: Dict[Optional[str], Tuple[str, str, str]] = {}
         
-    async def acquire(self, endpoint: Optional[str] = None) -> None:
-        """Check rate limit and wait if necessary
+    def _window_key(self, endpoint: Optional[str]) -> Optional[str]:
+        """Endpoints without their own limit share the default window"""
+        return endpoint if endpoint in self.endpoints else None
+        
+    def try_acquire(self, endpoint: Optional[str] = None) -> bool:
+        """Record a request if the window has capacity, without waiting
         
         Args:
             endpoint: Optional endpoint-specific rate limit to check
+            
+        Returns:
+            bool: True if the request was recorded, False if the window is full
         """
-        now = time.time()
-        limit = self.endpoints.get(endpoint, self.default_limit)
+        now = _now()
+        key = self._window_key(endpoint)
+        limit = self.endpoints.get(key, self.default_limit)
+        window = self.requests[key]
         
         # Clean old requests
-        self.requests = [t for t in self.requests if now - t < limit.time_window]
+        while window and now - window[0] >= limit.time_window:
+            window.popleft()
         
-        if len(self.requests) >= limit.max_requests:
-            retry_count = self.retry_counts.get(endpoint, 0)
-            try:
-                wait_time = await self.strategy.handle_rate_limit(
-                    retry_count,
-                    retry_after=int(limit.reset_time - now)
-                )
-                self.logger.warning(
-                    f"Rate limit reached, waiting {wait_time:.2f}s",
-                    extra={"category": DebugCategory.API.value}
+        if len(window) >= limit.max_requests:
+            return False
+            
+        window.append(now)
+        return True
+        
+    async def acquire(self, endpoint: Optional[str] = None) -> None:
+        """Check rate limit and wait if necessary
+        
+        Args:
+            endpoint: Optional endpoint-specific rate limit to check
+            
+        Raises:
+            RateLimitError: If capacity did not free up within the strategy's retries
+        """
+        key = self._window_key(endpoint)
+        lock = self._waiters[key]
+        # Fast path: capacity available and nobody queued ahead of us
+        if not lock.locked() and self.try_acquire(endpoint):
+            if self.retry_counts:
+                self.retry_counts.pop(key, None)
+            return
+            
+        # One waiter per endpoint at a time, re-checking capacity after each
+        # sleep, so a burst of callers can't all wake up and overshoot the limit
+        async with lock:
+            while not self.try_acquire(endpoint):
+                limit = self.endpoints.get(key, self.default_limit)
+                try:
+                    wait_time = await self.strategy.handle_rate_limit(
+                        self.retry_counts[key],
+                        # reset_time may already have passed
+                        retry_after=max(0, int(limit.reset_time - time.time()))
+                    )
+                except RateLimitError:
+                    self.retry_counts.pop(key, None)
+                    raise
+                # A full window frees a slot when its oldest request ages out;
+                # waiting for that is local bookkeeping, not a strategy retry
+                window = self.requests[key]
+                oldest_expiry = window[0] + limit.time_window - _now() if window else 0
+                local_wait = 0 < oldest_expiry < wait_time
+                if local_wait:
+                    # Slack so a timer firing a hair early doesn't re-check too soon
+                    wait_time = oldest_expiry + _EXPIRY_SLACK
+                logger.warning(
+                    "Rate limit reached, waiting %.2fs", wait_time
                 )
                 await asyncio.sleep(wait_time)
-                self.retry_counts[endpoint] = retry_count + 1
-            except RateLimitError as e:
-                self.retry_counts[endpoint] = 0
-                raise e
-            
-        self.requests.append(now)
+                if not local_wait:
+                    self.retry_counts[key] += 1
+            self.retry_counts.pop(key, None)
         
     def update_limits(self, headers: Dict[str, str], endpoint: Optional[str] = None) -> None:
         """Update rate limits from response headers
@@ -85,33 +148,46 @@ class RateLimiter:
             headers: Response headers containing rate limit information
             endpoint: Optional endpoint to update limits for
         """
+        limit_header = headers.get("x-rate-limit-limit")
+        if not limit_header:
+            return
+            
+        # Quota headers repeat across many responses; only parse when they change
+        raw = (
+            headers.get("x-rate-limit-remaining", "0"),
+            headers.get("x-rate-limit-reset", "0"),
+            limit_header
+        )
+        if self._last_headers.get(endpoint) == raw:
+            return
+        self._last_headers[endpoint] = raw
+            
         try:
-            remaining = int(headers.get("x-rate-limit-remaining", "0"))
-            reset_time = float(headers.get("x-rate-limit-reset", "0"))
-            max_requests = int(headers.get("x-rate-limit-limit", "0"))
+            max_requests = int(limit_header)
+            if max_requests <= 0:
+                return
+            remaining = int(raw[0])
+            reset_time = float(raw[1])
             
-            if max_requests > 0:
-                limit = RateLimit(
-                    max_requests=max_requests,
-                    time_window=int(reset_time - time.time()),
-                    remaining=remaining,
-                    reset_time=reset_time
-                )
-                
-                if endpoint:
-                    self.endpoints[endpoint] = limit
-                else:
-                    self.default_limit = limit
-                    
-                self.logger.debug(
-                    f"Updated rate limits: {remaining}/{max_requests} requests remaining",
-                    extra={"category": DebugCategory.API.value}
-                )
+            limit = RateLimit(
+                max_requests=max_requests,
+                time_window=int(reset_time - time.time()),
+                remaining=remaining,
+                reset_time=reset_time
+            )
+            
+            if endpoint:
+                self.endpoints[endpoint] = limit
+            else:
+                self.default_limit = limit
                 
-        except (ValueError, KeyError) as e:
-            self.logger.error(
-                f"Failed to parse rate limit headers: {str(e)}",
-                extra={"category": DebugCategory.API.value}
+            logger.debug(
+                "Updated rate limits: %s/%s requests remaining", remaining, max_requests
+            )
+            
+        except ValueError as e:
+            logger.error(
+                "Failed to parse rate limit headers: %s", e
             )
             
     def handle_429(self, retry_after: Optional[str] = None) -> float:
@@ -123,21 +199,19 @@ class RateLimiter:
         Returns:
             float: Number of seconds to wait before retrying
         """
-        try:
-            if retry_after:
-                wait_time = float(retry_after)
-            else:
-                wait_time = 60  # Default to 60 seconds
-                
-            self.logger.warning(
-                f"Rate limit exceeded, waiting {wait_time}s",
-                extra={"category": DebugCategory.API.value}
-            )
-            return wait_time
+        if not retry_after:
+            logger.warning("Rate limit exceeded, waiting 60s")
+            return 60.0  # Default to 60 seconds
             
+        try:
+            wait_time = float(retry_after)
         except ValueError as e:
-            self.logger.error(
-                f"Failed to parse Retry-After header: {str(e)}",
-                extra={"category": DebugCategory.API.value}
+            logger.error(
+                "Failed to parse Retry-After header: %s", e
             )
-            return 60  # Default to 60 seconds
+            return 60.0  # Default to 60 seconds
+            
+        logger.warning(
+            "Rate limit exceeded, waiting %ss", wait_time
+        )
+        return wait_time
@@ -1,31 +1,22 @@
 import os
 import asyncio
-from typing import AsyncGenerator
+from pathlib import Path
+from typing import TYPE_CHECKING, AsyncGenerator
 import pytest
+from pytest_asyncio import is_async_test
 import redis.asyncio
-import websockets
 
-from src.ai_response.model_manager import AIModelManager
-from src.chat_interface.handlers.api_handler import ChatHandler
-from src.chat_interface.services.analytics_collector import AnalyticsCollector
 from src.chat_interface.services.context_service import ContextManager
-from src.chat_interface.services.news_monitor import NewsMonitor
-from src.chat_interface.services.price_tracker import PriceTracker
 from src.chat_interface.services.response_formatter import ResponseFormatter
-from src.chat_interface.services.price_websocket import BinanceWebSocket
 from src.chat_interface.utils.circuit_breaker import CircuitBreaker
 from src.chat_interface.utils.metrics import Metrics
 from src.chat_interface.utils.rate_limiter import RateLimiter
-from .services.mock_websocket import MockWebSocket
 
-
-@pytest.fixture(scope="function")
-def event_loop():
-    """Create an event loop for testing"""
-    policy = asyncio.get_event_loop_policy()
-    loop = policy.new_event_loop()
-    yield loop
-    loop.close()
+# The API handler and its services are imported inside the fixtures that use
+# them, so collecting tests that don't need them skips building the app
+if TYPE_CHECKING:
+    from src.chat_interface.handlers.api_handler import ChatHandler
+    from src.chat_interface.services.price_websocket import BinanceWebSocket
 
 
 # Set test environment variables
@@ -34,42 +25,74 @@ os.environ["OLLAMA_API_URL"] = "http://localhost:11434"
 os.environ["DEEPSEEK_API_KEY"] = "test_key"
 
 
-async def create_redis_client():
-    """Helper function to create a Redis client"""
-    try:
-        client = await redis.asyncio.Redis.from_url(
-            "redis://localhost:6379/0",
-            decode_responses=False,
-            encoding='utf-8',
-            socket_timeout=5.0,
-            socket_connect_timeout=5.0
-        )
-        if not client:
-            raise RuntimeError("Failed to initialize Redis client")
-
-        # Verify connection and clear data with timeouts
-        try:
-            await asyncio.wait_for(client.ping(), timeout=5.0)
-            await asyncio.wait_for(client.flushdb(), timeout=5.0)
-        except asyncio.TimeoutError as e:
-            raise RuntimeError(f"Redis operation timed out: {str(e)}")
-
-        return client
-
-    except redis.RedisError as e:
-        raise RuntimeError(f"Redis initialization failed: {str(e)}")
-    except Exception as e:
-        raise RuntimeError(f"Unexpected error during Redis setup: {str(e)}")
+# pytest-xdist workers (gw0, gw1, ...) each get their own Redis database so
+# one worker's per-test flushdb cannot wipe another worker's keys. Run with
+# --dist loadfile: the websocket test server binds a fixed port. Redis only
+# has databases 0-15 by default, so past 15 workers the databases are reused.
+_XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+_REDIS_DB = int(_XDIST_WORKER[2:]) % 15 + 1 if _XDIST_WORKER else 0
+REDIS_URL = f"redis://localhost:6379/{_REDIS_DB}"
+
+_TESTS_DIR = Path(__file__).parent
+
+
+def pytest_collection_modifyitems(items):
+    """Run this package's async tests on the session event loop
+
+    Session-scoped async fixtures such as redis_session live on that loop,
+    so the tests using them have to run there too.
+    """
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item) and item.path.is_relative_to(_TESTS_DIR):
+            item.add_marker(session_loop, append=False)
+
+
+@pytest.fixture(scope="session")
+async def redis_pool() -> AsyncGenerator[redis.asyncio.ConnectionPool, None]:
+    """Create the connection pool every Redis client in the session draws from
+
+    Blocking, so concurrent bursts wait for a free connection instead of
+    failing with "Too many connections".
+    """
+    pool = redis.asyncio.BlockingConnectionPool.from_url(
+        REDIS_URL,
+        max_connections=32,
+        timeout=5.0,
+        decode_responses=False,
+        encoding='utf-8',
+        socket_timeout=5.0,
+        socket_connect_timeout=5.0
+    )
+    yield pool
+    await pool.disconnect()
+
+
+@pytest.fixture(scope="session")
+async def redis_session(redis_pool) -> AsyncGenerator[redis.asyncio.Redis, None]:
+    """Open one Redis client on the shared pool for the whole test session"""
+    client = redis.asyncio.Redis(connection_pool=redis_pool)
+    yield client
+    await client.aclose()
 
 
-@pytest.fixture(scope="function")
-async def rate_limiter() -> RateLimiter:
-    """Create a rate limiter instance for testing"""
+@pytest.fixture
+async def redis_client(redis_session) -> redis.asyncio.Redis:
+    """Return the session Redis client with the database flushed for this test"""
+    # Health check and cleanup in a single round trip
+    async with redis_session.pipeline(transaction=False) as pipe:
+        pipe.ping()
+        pipe.flushdb()
+        await asyncio.wait_for(pipe.execute(), timeout=5.0)
+    return redis_session
+
+
+@pytest.fixture(scope="session")
+async def _session_rate_limiter(redis_session) -> RateLimiter:
+    """Rate limiter shared by the session; its windows live in Redis"""
     try:
-        # Create a new Redis client for this fixture
-        redis_instance = await create_redis_client()
         # Create and initialize rate limiter
-        limiter = RateLimiter(redis_instance)
+        limiter = RateLimiter(redis_session)
         await asyncio.wait_for(limiter.initialize(), timeout=5.0)
         return limiter
     except asyncio.TimeoutError as e:
@@ -78,13 +101,17 @@ async def rate_limiter() -> RateLimiter:
         raise RuntimeError(f"Rate limiter initialization failed: {str(e)}")
 
 
+@pytest.fixture
+def rate_limiter(_session_rate_limiter, redis_client) -> RateLimiter:
+    """Return the session rate limiter; redis_client has flushed its windows"""
+    return _session_rate_limiter
+
+
 @pytest.fixture(scope="function")
-async def context_manager() -> ContextManager:
+async def context_manager(redis_client) -> ContextManager:
     """Create a context manager instance for testing"""
     try:
-        # Create a new Redis client for this fixture
-        redis_instance = await create_redis_client()
-        manager = ContextManager(redis_instance)
+        manager = ContextManager(redis_client)
         await asyncio.wait_for(manager.initialize(), timeout=5.0)
         return manager
     except asyncio.TimeoutError as e:
@@ -95,21 +122,35 @@ async def context_manager() -> ContextManager:
         raise RuntimeError(f"Context manager initialization failed: {str(e)}")
 
 
-@pytest.fixture
-def metrics() -> Metrics:
-    """Create a metrics instance for testing"""
+@pytest.fixture(scope="session")
+def _session_metrics() -> Metrics:
+    """Metrics instance shared by the session; reset before each use"""
     return Metrics()
 
 
-@pytest.fixture
-def circuit_breaker() -> CircuitBreaker:
-    """Create a circuit breaker instance for testing"""
+@pytest.fixture(scope="session")
+def _session_circuit_breaker() -> CircuitBreaker:
+    """Circuit breaker shared by the session; reset before each use"""
     return CircuitBreaker()
 
 
 @pytest.fixture
+def metrics(_session_metrics) -> Metrics:
+    """Return the session metrics instance with nothing recorded"""
+    _session_metrics.reset()
+    return _session_metrics
+
+
+@pytest.fixture
+def circuit_breaker(_session_circuit_breaker) -> CircuitBreaker:
+    """Return the session circuit breaker in its closed state"""
+    _session_circuit_breaker.reset()
+    return _session_circuit_breaker
+
+
+@pytest.fixture(scope="session")
 def response_formatter() -> ResponseFormatter:
-    """Create a response formatter instance for testing"""
+    """Create a response formatter instance for testing (stateless)"""
     return ResponseFormatter()
 
 
@@ -119,8 +160,12 @@ async def websocket_client(
     metrics,
     circuit_breaker,
     monkeypatch
-) -> AsyncGenerator[BinanceWebSocket, None]:
+) -> AsyncGenerator["BinanceWebSocket", None]:
     """Create a WebSocket client instance for testing"""
+    import websockets
+    from src.chat_interface.services.price_websocket import BinanceWebSocket
+    from .services.mock_websocket import MockWebSocket
+
     client = BinanceWebSocket(rate_limiter, metrics, circuit_breaker)
     mock_ws = None
 
@@ -148,88 +193,58 @@ async def websocket_client(
         await client.close()
     if mock_ws:
         await mock_ws.close()
-    # Wait for cleanup
-    await asyncio.sleep(0.2)
+        await asyncio.wait_for(mock_ws.closed.wait(), 1.0)
 
 
-@pytest.fixture(scope="function")
-async def chat_handler(monkeypatch) -> ChatHandler:
-    """创建测试用的聊天处理器"""
-    # Mock responses
-    async def mock_get_price_data():
-        return {
-            "berachain": {
-                "usd": 1.23,
-                "usd_24h_vol": 1000000,
-                "usd_24h_change": 5.67
-            }
-        }
-
-    async def mock_get_latest_news():
-        return [{
-            "title": "Test News",
-            "content": "Test Content",
-            "date": "2024-02-08"
-        }]
-
-    async def mock_analyze_sentiment():
-        return {
-            "sentiment": "positive",
-            "confidence": 0.8
-        }
-
-    async def mock_generate_content(*args, **kwargs):
-        return "AI generated response for testing"
+@pytest.fixture(scope="session")
+async def _session_chat_handler(redis_session) -> "ChatHandler":
+    """Chat handler wired to canned services, built once per session"""
+    from src.chat_interface.handlers.api_handler import ChatHandler
+    from .services.fake_services import (
+        FakeAnalyticsCollector,
+        FakeModelManager,
+        FakeNewsMonitor,
+        FakePriceTracker
+    )
 
     try:
-        # Create Redis clients for each component
-        redis_instance = await create_redis_client()
-        
-        # Initialize rate limiter
-        rate_limiter = RateLimiter(redis_instance)
-        await asyncio.wait_for(rate_limiter.initialize(), timeout=5.0)
-        
-        # Initialize context manager
-        context_manager = ContextManager(redis_instance)
-        await asyncio.wait_for(context_manager.initialize(), timeout=5.0)
-
-        # Initialize model manager with mock
-        model_manager = AIModelManager()
-        await model_manager.initialize()
-        monkeypatch.setattr(
-            model_manager, "generate_content", mock_generate_content
-        )
+        rate_limiter = RateLimiter(redis_session)
+        context_manager = ContextManager(redis_session)
+        model_manager = FakeModelManager()
 
         # Create metrics and circuit breaker
         metrics_instance = Metrics()
         circuit_breaker_instance = CircuitBreaker()
         response_formatter_instance = ResponseFormatter()
 
-        # Initialize services with dependencies and mocks
-        price_tracker = PriceTracker(
+        # Create services with dependencies
+        price_tracker = FakePriceTracker(
             rate_limiter=rate_limiter,
             metrics=metrics_instance,
             circuit_breaker=circuit_breaker_instance
         )
-        await price_tracker.initialize()
-        monkeypatch.setattr(price_tracker, "get_price_data", mock_get_price_data)
-
-        news_monitor = NewsMonitor(
+        news_monitor = FakeNewsMonitor(
             rate_limiter=rate_limiter,
             metrics=metrics_instance,
             circuit_breaker=circuit_breaker_instance
         )
-        await news_monitor.initialize()
-        monkeypatch.setattr(news_monitor, "get_latest_news", mock_get_latest_news)
-
-        analytics_collector = AnalyticsCollector(
+        analytics_collector = FakeAnalyticsCollector(
             rate_limiter=rate_limiter,
             metrics=metrics_instance,
             circuit_breaker=circuit_breaker_instance
         )
-        await analytics_collector.initialize()
-        monkeypatch.setattr(
-            analytics_collector, "analyze_market_sentiment", mock_analyze_sentiment
+
+        # The initializers are independent, so run them concurrently
+        await asyncio.wait_for(
+            asyncio.gather(
+                rate_limiter.initialize(),
+                context_manager.initialize(),
+                model_manager.initialize(),
+                price_tracker.initialize(),
+                news_monitor.initialize(),
+                analytics_collector.initialize()
+            ),
+            timeout=5.0
         )
 
         # Create and initialize handler with dependencies
@@ -248,3 +263,10 @@ async def chat_handler(monkeypatch) -> ChatHandler:
         raise RuntimeError(f"Chat handler initialization timed out: {str(e)}")
     except Exception as e:
         raise RuntimeError(f"Chat handler initialization failed: {str(e)}")
+
+
+@pytest.fixture
+def chat_handler(_session_chat_handler, redis_client) -> "ChatHandler":
+    """创建测试用的聊天处理器"""
+    # Depending on redis_client flushes rate limits and context between tests
+    return _session_chat_handler
@@ -0,0 +1,52 @@
+from typing import Dict, Any, List
+
+from src.ai_response.model_manager import AIModelManager
+from src.chat_interface.services.analytics_collector import AnalyticsCollector
+from src.chat_interface.services.news_monitor import NewsMonitor
+from src.chat_interface.services.price_tracker import PriceTracker
+
+
+PRICE_DATA: Dict[str, Any] = {
+    "berachain": {
+        "usd": 1.23,
+        "usd_24h_vol": 1000000,
+        "usd_24h_change": 5.67
+    }
+}
+
+NEWS_DATA: List[Dict[str, Any]] = [{
+    "title": "Test News",
+    "content": "Test Content",
+    "date": "2024-02-08"
+}]
+
+SENTIMENT_DATA: Dict[str, Any] = {
+    "sentiment": "positive",
+    "confidence": 0.8
+}
+
+AI_RESPONSE = "AI generated response for testing"
+
+
+class FakePriceTracker(PriceTracker):
+    """Price tracker returning fixed price data"""
+    async def get_price_data(self) -> Dict[str, Any]:
+        return PRICE_DATA
+
+
+class FakeNewsMonitor(NewsMonitor):
+    """News monitor returning a fixed article"""
+    async def get_latest_news(self) -> List[Dict[str, Any]]:
+        return NEWS_DATA
+
+
+class FakeAnalyticsCollector(AnalyticsCollector):
+    """Analytics collector returning a fixed sentiment"""
+    async def analyze_market_sentiment(self) -> Dict[str, Any]:
+        return SENTIMENT_DATA
+
+
+class FakeModelManager(AIModelManager):
+    """Model manager returning a fixed response without calling Ollama"""
+    async def generate_content(self, *args: Any, **kwargs: Any) -> str:
+        return AI_RESPONSE
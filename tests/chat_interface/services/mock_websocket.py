@@ -1,8 +1,36 @@
+import re
 import json
 import time
 import asyncio
-import websockets
-from typing import Dict, Any, List
+import websockets.exceptions
+from collections import deque
+from typing import Deque, Dict, Any, List, Tuple
+
+
+# Payloads are encoded once; only the symbol, id and event time vary per message
+_SUB_CONFIRM_TEMPLATE = json.dumps({"result": None, "id": 0}).replace(
+    '"id": 0', '"id": %d'
+)
+_TICKER_TEMPLATE = json.dumps({
+    "e": "24hrTicker",
+    "s": "%s",
+    "c": "1.23",
+    "p": "0.05",
+    "P": "4.23",
+    "v": "1000000",
+    "E": 0
+}).replace('"E": 0', '"E": %d')
+
+# The exact single-symbol (UN)SUBSCRIBE shape BinanceWebSocket sends; anything
+# else goes through json.loads
+_SUBSCRIPTION_RE = re.compile(
+    r'\{"method": "(SUBSCRIBE|UNSUBSCRIBE)", "params": \["([^"\\]+)"\], "id": \d+\}'
+)
+
+# Built once and re-raised; with_traceback(None) keeps tracebacks from piling up
+_CONNECTION_CLOSED = websockets.exceptions.ConnectionClosed(None, None)
+# Use 429 for rate limit
+_RATE_LIMITED = websockets.exceptions.InvalidStatusCode(None, 429)
 
 
 class MockWebSocket:
@@ -11,25 +39,35 @@ class MockWebSocket:
         self.url = url
         self.connected = False  # Start disconnected
         self.messages: List[Dict[str, Any]] = []
-        self.subscriptions: List[str] = []
+        self.subscriptions: set[str] = set()
+        # Bumped on every (UN)SUBSCRIBE so the producer re-snapshots only then
+        self._sub_rev = 0
         self.rate_limiter = rate_limiter
-        self.message_queue = asyncio.Queue()
+        # Single-loop producer/consumer; oldest messages drop when full
+        self.message_queue: Deque[str] = deque(maxlen=1024)
         self._message_task = None
         self._initialized = False
         self._running = False
+        # Wake the producer when there is something to send or someone to read
+        self._subs_event = asyncio.Event()
+        self._demand_event = asyncio.Event()
+        # Public hooks so tests can await state changes instead of sleeping
+        self.subscribed = asyncio.Event()
+        self.closed = asyncio.Event()
 
     async def connect(self) -> None:
         """Simulate connection"""
         try:
-            # Check rate limit before allowing connection
+            # Check rate limit before allowing connection. The server-side
+            # budgets use their own keys so they don't double-count the
+            # client's "binance_ws" subscription limit.
             if not await self.rate_limiter.check_rate_limit(
-                "binance_ws", limit=5, window=60
+                "mock_binance_connect", limit=5, window=60
             ):
-                # Use 429 for rate limit
-                raise websockets.exceptions.InvalidStatusCode(None, 429)
+                raise _RATE_LIMITED.with_traceback(None)
 
             # Cancel existing task if any
-            if hasattr(self, '_message_task') and self._message_task:
+            if self._message_task:
                 try:
                     self._message_task.cancel()
                     try:
@@ -42,53 +80,25 @@ class MockWebSocket:
                     self._message_task = None
                 
             # Clear message queue
-            while not self.message_queue.empty():
-                try:
-                    self.message_queue.get_nowait()
-                except asyncio.QueueEmpty:
-                    break
+            self.message_queue.clear()
 
             # Set flags before starting task
             self._initialized = True
             self._running = True
             self.connected = True
+            self.closed.clear()
 
             # Start message sending task
             self._message_task = asyncio.create_task(self._send_messages())
             
-            # Wait for task to start and verify it's running
-            try:
-                # Overall timeout for initialization
-                async with asyncio.timeout(0.5):
-                    # Try up to 5 times
-                    for _ in range(5):
-                        if self._message_task and not self._message_task.done():
-                            break
-                        await asyncio.sleep(0.1)
-                    else:
-                        raise RuntimeError("Failed to start message task")
-            except Exception as exc:
-                self._initialized = False
-                self._running = False
-                self.connected = False
-                if hasattr(self, '_message_task') and self._message_task:
-                    self._message_task.cancel()
-                    try:
-                        await asyncio.wait_for(
-                            self._message_task, timeout=0.1
-                        )
-                    except (asyncio.TimeoutError, asyncio.CancelledError):
-                        pass
-                    self._message_task = None
-                raise RuntimeError(
-                    f"Failed to initialize WebSocket: {str(exc)}"
-                )
-                
+            # Yield once so the producer reaches its first await
+            await asyncio.sleep(0)
+
         except Exception:
             self._initialized = False
             self._running = False
             self.connected = False
-            if hasattr(self, '_message_task') and self._message_task:
+            if self._message_task:
                 self._message_task.cancel()
                 try:
                     await asyncio.wait_for(
@@ -102,32 +112,38 @@ class MockWebSocket:
     async def send(self, message: str) -> None:
         """Handle subscription messages"""
         if not self.connected:
-            raise websockets.exceptions.ConnectionClosed(None, None)
+            raise _CONNECTION_CLOSED.with_traceback(None)
             
         try:
-            data = json.loads(message)
+            match = _SUBSCRIPTION_RE.fullmatch(message)
+            if match:
+                data = {"method": match[1], "params": [match[2]]}
+            else:
+                data = json.loads(message)
             if data["method"] == "SUBSCRIBE":
                 # Check rate limit before allowing subscription
                 if not await self.rate_limiter.check_rate_limit(
-                    "binance_ws",
+                    "mock_binance_subscribe",
                     limit=5,
                     window=60
                 ):
-                    raise websockets.exceptions.InvalidStatusCode(None, 429)
+                    raise _RATE_LIMITED.with_traceback(None)
 
                 # Add new subscriptions
-                for param in data["params"]:
-                    if param not in self.subscriptions:
-                        self.subscriptions.append(param)
+                self.subscriptions.update(data["params"])
+                self._sub_rev += 1
+                self._subs_event.set()
+                self.subscribed.set()
 
             elif data["method"] == "UNSUBSCRIBE":
                 # Remove subscriptions
-                for param in data["params"]:
-                    if param in self.subscriptions:
-                        self.subscriptions.remove(param)
+                self.subscriptions.difference_update(data["params"])
+                self._sub_rev += 1
+                if not self.subscriptions:
+                    self.subscribed.clear()
 
             if not self.connected:  # Check connection after operation
-                raise websockets.exceptions.ConnectionClosed(None, None)
+                raise _CONNECTION_CLOSED.with_traceback(None)
 
         except json.JSONDecodeError:
             raise websockets.exceptions.InvalidMessage(
@@ -139,13 +155,13 @@ class MockWebSocket:
             )
         except Exception:
             if not self.connected:
-                raise websockets.exceptions.ConnectionClosed(None, None)
+                raise _CONNECTION_CLOSED.with_traceback(None)
             raise
 
     async def recv(self) -> str:
         """Return mock price update"""
         if not (self.connected and self._running and self._initialized):
-            raise websockets.exceptions.ConnectionClosed(None, None)
+            raise _CONNECTION_CLOSED.with_traceback(None)
             
         if not self.subscriptions:
             await asyncio.sleep(0.05)  # Small network delay
@@ -153,33 +169,21 @@ class MockWebSocket:
 
         try:
             # Get next message from queue with timeout
+            if not self.message_queue:
+                # Ask the producer for a fresh round and yield so it can run
+                self._demand_event.set()
+                await asyncio.sleep(0)
             try:
-                message = self.message_queue.get_nowait()
-            except asyncio.QueueEmpty:
-                # If queue is empty, return error immediately
+                message = self.message_queue.popleft()
+            except IndexError:
                 return json.dumps({"e": "error", "m": "No messages available"})
             
             if not (
                 self.connected and self._running and self._initialized
             ):
-                raise websockets.exceptions.ConnectionClosed(None, None)
-            
-            # Parse message and update timestamp
-            try:
-                data = json.loads(message)
-                data["E"] = int(time.time() * 1000)
-                
-                # Only queue another message if we're still connected
-                if (
-                    self.connected and self._running and self._initialized
-                ):
-                    try:
-                        self.message_queue.put_nowait(json.dumps(data))
-                    except asyncio.QueueFull:
-                        pass  # Ignore if queue is full
-            except Exception:
-                pass  # Ignore any parsing errors
-                
+                raise _CONNECTION_CLOSED.with_traceback(None)
+
+            # The producer task emits fresh messages; nothing to re-queue here
             return message
             
         except asyncio.CancelledError:
@@ -191,78 +195,48 @@ class MockWebSocket:
                 self._running and
                 self._initialized
             ):
-                raise websockets.exceptions.ConnectionClosed(None, None)
+                raise _CONNECTION_CLOSED.with_traceback(None)
             return json.dumps({
                 "e": "error",
                 "m": "Error receiving message"
             })
 
     async def _send_messages(self) -> None:
-        """Continuously send messages in the background"""
+        """Send a round of messages each time recv() drains the queue"""
+        snapshot: Tuple[str, ...] = ()
+        rev = -1
         try:
             while self.connected and self._running and self._initialized:
-                if not self.subscriptions:
-                    await asyncio.sleep(0.001)
-                    continue
+                if rev != self._sub_rev:
+                    snapshot, rev = tuple(self.subscriptions), self._sub_rev
 
-                for subscription in list(self.subscriptions):
-                    if not (
-                        self.connected and self._running and self._initialized
-                    ):
-                        return
+                if not snapshot:
+                    self._subs_event.clear()
+                    await self._subs_event.wait()
+                    continue
 
+                # One event time and confirmation per round, shared by every symbol
+                now_ms = time.time_ns() // 1_000_000
+                sub_confirm = _SUB_CONFIRM_TEMPLATE % len(snapshot)
+                for subscription in snapshot:
                     symbol = subscription.split("@")[0].upper()
 
                     # Send subscription confirmation
-                    sub_confirm = {
-                        "result": None,
-                        "id": len(self.subscriptions)
-                    }
-                    try:
-                        self.message_queue.put_nowait(json.dumps(sub_confirm))
-                    except (asyncio.QueueFull, Exception):
-                        continue
+                    self.message_queue.append(sub_confirm)
 
                     # Send one price update immediately
-                    if not (
-                        self.connected and self._running and self._initialized
-                    ):
-                        return
+                    data = _TICKER_TEMPLATE % (symbol, now_ms)
+                    self.message_queue.append(data)
 
-                    data = {
-                        "e": "24hrTicker",
-                        "s": symbol,
-                        "c": "1.23",
-                        "p": "0.05",
-                        "P": "4.23",
-                        "v": "1000000",
-                        "E": int(time.time() * 1000)
-                    }
-                    try:
-                        self.message_queue.put_nowait(json.dumps(data))
-                    except (asyncio.QueueFull, Exception):
-                        continue
-
-                    await asyncio.sleep(0.0001)
-
-                if not (self.connected and self._running and self._initialized):
-                    return
-
-                await asyncio.sleep(0.0001)
+                self._demand_event.clear()
+                await self._demand_event.wait()
         except asyncio.CancelledError:
             print("Message task cancelled")
         finally:
             self._initialized = False
             self._running = False
             self.connected = False
-            try:
-                while not self.message_queue.empty():
-                    try:
-                        self.message_queue.get_nowait()
-                    except (asyncio.QueueEmpty, Exception):
-                        break
-            except Exception:
-                pass
+            self.message_queue.clear()
 
     async def close(self) -> None:
         """Close connection"""
@@ -271,33 +245,22 @@ class MockWebSocket:
         self._running = False
         self.connected = False
         
-        # Cancel message task immediately
-        if hasattr(self, '_message_task') and self._message_task:
-            try:
-                self._message_task.cancel()
-                try:
-                    await asyncio.wait_for(self._message_task, timeout=0.1)
-                except (asyncio.TimeoutError, asyncio.CancelledError):
-                    pass
-            except Exception:
-                pass
-            finally:
-                self._message_task = None
+        # Cancel message task immediately; the producer only ever parks on an
+        # event, so one loop iteration is enough for it to unwind
+        if self._message_task:
+            task, self._message_task = self._message_task, None
+            task.cancel()
+            await asyncio.sleep(0)
+            if not task.done():
+                await asyncio.wait((task,), timeout=0.1)
                 
         # Clear message queue immediately
-        try:
-            while True:
-                try:
-                    self.message_queue.get_nowait()
-                except asyncio.QueueEmpty:
-                    break
-                except Exception:
-                    break
-        except Exception:
-            pass
+        self.message_queue.clear()
                 
         # Clear subscriptions immediately
         try:
             self.subscriptions.clear()
         except Exception:
             pass
+        self.subscribed.clear()
+        self.closed.set()
@@ -1,10 +1,16 @@
+import json
 import pytest
 from src.chat_interface.services.chart_service import TradingViewChart
 
 
-def test_tradingview_config():
+@pytest.fixture(scope="module")
+def chart() -> TradingViewChart:
+    """Chart instance shared by the module; tests only read its config"""
+    return TradingViewChart()
+
+
+def test_tradingview_config(chart):
     """Test TradingView widget configuration"""
-    chart = TradingViewChart()
     config = chart.widget_config
     assert "symbol" in config
     assert config["symbol"] == "BERAUSDT"
@@ -14,16 +20,13 @@ def test_tradingview_config():
     assert config["locale"] == "zh_CN"  # Verify Chinese locale
 
 
-def test_widget_config_overrides():
+def test_widget_config_overrides(chart):
     """Test widget configuration overrides"""
-    chart = TradingViewChart()
     config = chart.get_widget_config(
         symbol="BERABTC",
         interval="1H",
         theme="light",
         studies=["RSI", "MACD"]
-
-        theme="light"
     )
     assert config["symbol"] == "BERABTC"
     assert config["interval"] == "1H"
@@ -32,9 +35,8 @@ def test_widget_config_overrides():
 
 
 
-def test_widget_html_generation():
+def test_widget_html_generation(chart):
     """Test widget HTML code generation"""
-    chart = TradingViewChart()
     html = chart.get_widget_html()
     assert "TradingView Widget" in html
     assert "tradingview-widget-container" in html
@@ -44,9 +46,8 @@ def test_widget_html_generation():
 
 
 
-def test_widget_html_with_overrides():
+def test_widget_html_with_overrides(chart):
     """Test widget HTML generation with overrides"""
-    chart = TradingViewChart()
     html = chart.get_widget_html(
         symbol="BERABTC",
         interval="1H",
@@ -57,15 +58,10 @@ def test_widget_html_with_overrides():
     assert "light" in html
     assert "RSI" in html
     assert "MACD" in html
-        theme="light"
-    )
-    assert "BERABTC" in html
-    assert "light" in html
 
 
-def test_chart_url_generation():
+def test_chart_url_generation(chart):
     """Test chart URL generation"""
-    chart = TradingViewChart()
     url = chart.get_chart_url()
     assert "tradingview.com/chart" in url
     assert "BERA" in url
@@ -73,9 +69,8 @@ def test_chart_url_generation():
     assert "theme" in url
 
 
-def test_chart_url_with_overrides():
+def test_chart_url_with_overrides(chart):
     """Test chart URL generation with overrides"""
-    chart = TradingViewChart()
     url = chart.get_chart_url(
         symbol="BERABTC",
         interval="1H",
@@ -88,9 +83,8 @@ def test_chart_url_with_overrides():
     assert "theme=light" in url
 
 
-def test_config_js_formatting():
+def test_config_js_formatting(chart):
     """Test JavaScript configuration formatting"""
-    chart = TradingViewChart()
     config = {
         "symbol": "BERAUSDT",
         "interval": "D",
@@ -98,8 +92,9 @@ def test_config_js_formatting():
         "studies": ["RSI", "MASimple"]
     }
     js_config = chart._format_config_for_js(config)
-    assert '"symbol": "BERAUSDT"' in js_config
-    assert '"interval": "D"' in js_config
-    assert '"enable_publishing": false' in js_config
-    # Check studies array content regardless of quote style
-    assert any(f'studies": [{q}RSI{q},{q}MASimple{q}]' in js_config for q in ['"', "'"])
+    # The formatter emits the members of a JSON object literal
+    parsed = json.loads("{" + js_config + "}")
+    assert parsed["symbol"] == "BERAUSDT"
+    assert parsed["interval"] == "D"
+    assert parsed["enable_publishing"] is False
+    assert parsed["studies"] == ["RSI", "MASimple"]
@@ -4,20 +4,20 @@ from src.chat_interface.services.context_service import ContextManager
 
 @pytest.mark.asyncio
 async def test_context_manager_init(context_manager: ContextManager):
-    manager = await context_manager
+    manager = context_manager
     assert manager.max_context_rounds == 5
 
 
 @pytest.mark.asyncio
 async def test_get_context_empty(context_manager: ContextManager):
-    manager = await context_manager
+    manager = context_manager
     context = await manager.get_context("test_session")
     assert context == []
 
 
 @pytest.mark.asyncio
 async def test_add_and_get_message(context_manager: ContextManager):
-    manager = await context_manager
+    manager = context_manager
     session_id = "test_session"
     test_message = {"role": "user", "content": "test message"}
 
@@ -30,16 +30,18 @@ async def test_add_and_get_message(context_manager: ContextManager):
 
 @pytest.mark.asyncio
 async def test_context_limit(context_manager: ContextManager):
-    manager = await context_manager
+    manager = context_manager
     session_id = "test_session"
     max_messages = manager.max_context_rounds * 2
 
     # Add more messages than the limit
-    for i in range(max_messages + 5):
-        await manager.add_message(
-            session_id,
+    await manager.add_messages(
+        session_id,
+        [
             {"role": "user", "content": f"message {i}"}
-        )
+            for i in range(max_messages + 5)
+        ]
+    )
 
     context = await manager.get_context(session_id)
     # Should have first message + last 2 rounds (4 messages)
@@ -51,3 +53,18 @@ async def test_context_limit(context_manager: ContextManager):
     assert context[-3]["content"] == "message 12"
     assert context[-2]["content"] == "message 13"
     assert context[-1]["content"] == "message 14"
+
+
+@pytest.mark.asyncio
+async def test_add_messages_matches_add_message(context_manager: ContextManager):
+    manager = context_manager
+    messages = [
+        {"role": "user" if i % 2 == 0 else "assistant", "content": f"message {i}"}
+        for i in range(13)
+    ]
+
+    for message in messages:
+        await manager.add_message("one_by_one", message)
+    await manager.add_messages("bulk", messages)
+
+    assert await manager.get_context("bulk") == await manager.get_context("one_by_one")
@@ -10,7 +10,7 @@ from ..services.mock_websocket import MockWebSocket
 async def test_websocket_initialization(websocket_client):
     """Test WebSocket client initialization"""
     async with asyncio.timeout(5.0):
-        client = await anext(websocket_client)
+        client = websocket_client
         # Initialize should already be called by fixture
         assert client._initialized is True, "WebSocket should be initialized"
         assert client._running is True, "WebSocket should be running"
@@ -25,7 +25,7 @@ async def test_websocket_initialization(websocket_client):
 @pytest.mark.asyncio
 async def test_price_subscription(websocket_client):
     """Test price update subscription"""
-    client = await anext(websocket_client)
+    client = websocket_client
     received_data = None
 
     async def price_callback(data: Dict[str, Any]):
@@ -38,8 +38,8 @@ async def test_price_subscription(websocket_client):
         callback=price_callback
     )
 
-    # Wait a bit for subscription to complete
-    await asyncio.sleep(0.1)
+    # Wait for the mock to acknowledge the subscription
+    await asyncio.wait_for(client.ws.subscribed.wait(), 1.0)
 
     assert "BERAUSDT".lower() in client.subscribed_symbols
     assert client.ws is not None
@@ -49,14 +49,14 @@ async def test_price_subscription(websocket_client):
 @pytest.mark.asyncio
 async def test_websocket_reconnection(websocket_client):
     """Test WebSocket reconnection logic"""
-    client = await anext(websocket_client)
+    client = websocket_client
     
     async def verify_connection():
         """Helper to verify connection state"""
         assert client.ws is not None, "WebSocket connection should exist"
         assert client._initialized is True, "WebSocket should be initialized"
         assert client._running is True, "WebSocket should be running"
-        await asyncio.sleep(0.1)  # Give time for internal state to update
+        await asyncio.wait_for(client.ws.subscribed.wait(), 1.0)
     
     async def _test_reconnection():
         try:
@@ -69,7 +69,7 @@ async def test_websocket_reconnection(websocket_client):
             if old_ws:
                 await old_ws.close()
                 client.ws = None
-                await asyncio.sleep(0.1)  # Wait for cleanup
+                await asyncio.wait_for(old_ws.closed.wait(), 1.0)
                 
                 # Verify disconnected state
                 assert client.ws is None, "WebSocket should be None after close"
@@ -102,7 +102,7 @@ async def test_websocket_reconnection(websocket_client):
 @pytest.mark.asyncio
 async def test_unsubscribe_price_updates(websocket_client):
     """Test unsubscribing from price updates"""
-    client = await anext(websocket_client)
+    client = websocket_client
     symbol = "BERAUSDT"
     
     async def verify_state(expected_subscribed: bool):
@@ -124,8 +124,8 @@ async def test_unsubscribe_price_updates(websocket_client):
         await client.subscribe_price_updates(symbol)
         await verify_state(expected_subscribed=True)
         
-        # Small delay to ensure subscription is processed
-        await asyncio.sleep(0.1)
+        # Wait for the mock to acknowledge the subscription
+        await asyncio.wait_for(client.ws.subscribed.wait(), 1.0)
         
         # Unsubscribe
         await client.unsubscribe_price_updates(symbol)
@@ -142,7 +142,7 @@ async def test_unsubscribe_price_updates(websocket_client):
 @pytest.mark.asyncio
 async def test_rate_limit_handling(websocket_client):
     """Test rate limit handling for WebSocket connections"""
-    client = await anext(websocket_client)
+    client = websocket_client
     
     async def verify_subscription(symbol: str, should_succeed: bool):
         """Helper to verify subscription attempt"""
@@ -182,7 +182,7 @@ async def test_rate_limit_handling(websocket_client):
 @pytest.mark.asyncio
 async def test_message_handler(websocket_client):
     """Test WebSocket message handling"""
-    client = await anext(websocket_client)
+    client = websocket_client
     received_data = None
     callback_executed = asyncio.Event()
 
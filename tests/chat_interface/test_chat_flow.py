@@ -1,29 +1,74 @@
+import re
 import pytest
-import asyncio
-from fastapi.testclient import TestClient
-from unittest.mock import patch
+from contextlib import ExitStack
+from typing import AsyncIterator, Dict, Iterator
+from httpx import ASGITransport, AsyncClient
+from unittest.mock import MagicMock, patch
 
-from src.chat_interface.handlers.api_handler import (
-    app, rate_limiter, context_manager, initialize_redis
-)
+from src.chat_interface.handlers.api_handler import app
 
 
-# Initialize Redis client for tests
-async def init_redis():
-    redis_client = await initialize_redis()
-    rate_limiter._redis_client = redis_client
-    context_manager._redis_client = redis_client
-    await rate_limiter.initialize()
-    await context_manager.initialize()
+PATCH_TARGETS = {
+    "price": (
+        'src.chat_interface.handlers.api_handler'
+        '._get_price_data'
+    ),
+    "news": (
+        'src.chat_interface.services.news_monitor'
+        '.NewsMonitor.get_latest_news'
+    ),
+    "sentiment": (
+        'src.chat_interface.services.analytics_collector'
+        '.AnalyticsCollector.analyze_market_sentiment'
+    ),
+    "ai": 'src.ai_response.model_manager.AIModelManager.generate_content',
+    "rate_limit": (
+        'src.chat_interface.utils.rate_limiter'
+        '.RateLimiter.check_rate_limit'
+    ),
+}
+
+
+_MARKET_TOKENS = ("📈 当前价格", "💰 24小时交易量", "📊 价格变动")
+_MARKET_RE = re.compile("|".join(map(re.escape, _MARKET_TOKENS)))
+
+_NEWS_TOKENS = ("📰 标题", "Test News", "Test Content")
+_NEWS_RE = re.compile("|".join(map(re.escape, _NEWS_TOKENS)))
 
-# Run Redis initialization
-asyncio.run(init_redis())
 
-client = TestClient(app)
+@pytest.fixture(scope="module")
+async def client() -> AsyncIterator[AsyncClient]:
+    """In-process client; app startup (Redis and services) runs once per module"""
+    # ASGITransport does not send lifespan events, so drive them here
+    async with app.router.lifespan_context(app):
+        async with AsyncClient(
+            transport=ASGITransport(app=app),
+            base_url="http://testserver"
+        ) as c:
+            yield c
+
+
+@pytest.fixture(scope="module")
+def _module_mocks() -> Iterator[Dict[str, MagicMock]]:
+    """Start every patcher once for the whole module"""
+    with ExitStack() as stack:
+        yield {
+            name: stack.enter_context(patch(target))
+            for name, target in PATCH_TARGETS.items()
+        }
+
+
+@pytest.fixture
+def mocks(_module_mocks) -> Dict[str, MagicMock]:
+    """Module mocks with results cleared; requests pass the rate limit"""
+    for mock in _module_mocks.values():
+        mock.reset_mock(return_value=True, side_effect=True)
+    _module_mocks["rate_limit"].return_value = True
+    return _module_mocks
 
 
 @pytest.mark.asyncio
-async def test_full_chat_flow():
+async def test_full_chat_flow(client, mocks):
     """Test complete chat flow with all components"""
     # Mock external service responses
     price_data = {
@@ -44,116 +89,77 @@ async def test_full_chat_flow():
         confidence=0.8
     )
 
-    price_patch = (
-        'src.chat_interface.handlers.api_handler'
-        '._get_price_data'
-    )
-    news_patch = (
-        'src.chat_interface.services.news_monitor'
-        '.NewsMonitor.get_latest_news'
-    )
-    sentiment_patch = (
-        'src.chat_interface.services.analytics_collector'
-        '.AnalyticsCollector.analyze_market_sentiment'
+    mocks["price"].return_value = price_data
+    mocks["news"].return_value = news_data
+    mocks["sentiment"].return_value = sentiment_data
+    mocks["ai"].return_value = "BERA price analysis response"
+
+    # Test chat request
+    response = await client.post(
+        "/api/chat",
+        json={
+            "message": "What's the current BERA price?",
+            "session_id": "test_session"
+        }
     )
-    ai_patch = 'src.ai_response.model_manager.AIModelManager.generate_content'
-
-    with patch(price_patch) as mock_price, \
-         patch(news_patch) as mock_news, \
-         patch(sentiment_patch) as mock_sentiment, \
-         patch(ai_patch) as mock_ai:
-
-        mock_price.return_value = price_data
-        mock_news.return_value = news_data
-        mock_sentiment.return_value = sentiment_data
-        mock_ai.return_value = "BERA price analysis response"
-
-        # Test chat request
-        response = client.post(
-            "/api/chat",
-            json={
-                "message": "What's the current BERA price?",
-                "session_id": "test_session"
-            }
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-
-        # Verify response structure
-        assert "ai_response" in data
-        assert "market_data" in data
-        assert "news" in data
-        assert "sentiment" in data
-
-        # Verify AI response
-        assert data["ai_response"] == "BERA price analysis response"
-
-        # Verify market data formatting
-        assert "📈 当前价格" in data["market_data"]
-        assert "💰 24小时交易量" in data["market_data"]
-        assert "📊 价格变动" in data["market_data"]
-
-        # Verify news data
-        assert "📰 标题" in data["news"]
-        assert "Test News" in data["news"]
-        assert "Test Content" in data["news"]
-
-        # Verify sentiment data
-        assert data["sentiment"]["sentiment"] == "positive"
-        assert data["sentiment"]["confidence"] == 0.8
+
+    assert response.status_code == 200
+    data = response.json()
+
+    # Verify response structure
+    assert "ai_response" in data
+    assert "market_data" in data
+    assert "news" in data
+    assert "sentiment" in data
+
+    # Verify AI response
+    assert data["ai_response"] == "BERA price analysis response"
+
+    # Verify market data formatting
+    assert set(_MARKET_RE.findall(data["market_data"])) == set(_MARKET_TOKENS)
+
+    # Verify news data
+    assert set(_NEWS_RE.findall(data["news"])) == set(_NEWS_TOKENS)
+
+    # Verify sentiment data
+    assert data["sentiment"]["sentiment"] == "positive"
+    assert data["sentiment"]["confidence"] == 0.8
 
 
 @pytest.mark.asyncio
-async def test_rate_limit_handling():
+async def test_rate_limit_handling(client, mocks):
     """Test rate limit handling in chat flow"""
-    rate_limit_patch = (
-        'src.chat_interface.utils.rate_limiter'
-        '.RateLimiter.check_rate_limit'
-    )
-    with patch(rate_limit_patch) as mock_rate_limit:
-        mock_rate_limit.return_value = False
+    mocks["rate_limit"].return_value = False
 
-        response = client.post(
-            "/api/chat",
-            json={
-                "message": "Test message",
-                "session_id": "test_session"
-            }
-        )
+    response = await client.post(
+        "/api/chat",
+        json={
+            "message": "Test message",
+            "session_id": "test_session"
+        }
+    )
 
-        assert response.status_code == 429  # Rate limit status code
-        data = response.json()
-        assert data["error"] == "Service unavailable"
-        assert data["message"] == "Rate limit exceeded"
-        assert "retry_after" in data
+    assert response.status_code == 429  # Rate limit status code
+    data = response.json()
+    assert data["error"] == "Service unavailable"
+    assert data["message"] == "Rate limit exceeded"
+    assert "retry_after" in data
 
 
 @pytest.mark.asyncio
-async def test_error_handling():
+async def test_error_handling(client, mocks):
     """Test error handling in chat flow"""
-    price_patch = (
-        'src.chat_interface.handlers.api_handler'
-        '._get_price_data'
-    )
-    rate_limit_patch = (
-        'src.chat_interface.utils.rate_limiter'
-        '.RateLimiter.check_rate_limit'
+    mocks["price"].side_effect = Exception("Test error")
+
+    response = await client.post(
+        "/api/chat",
+        json={
+            "message": "Test message",
+            "session_id": "test_session"
+        }
     )
-    with patch(price_patch) as mock_price, \
-         patch(rate_limit_patch) as mock_rate_limit:
-        mock_price.side_effect = Exception("Test error")
-        mock_rate_limit.return_value = True  # Allow request to pass rate limit
-
-        response = client.post(
-            "/api/chat",
-            json={
-                "message": "Test message",
-                "session_id": "test_session"
-            }
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert "❌ 错误" in data["market_data"]
-        assert "Unexpected error" in data["market_data"]
+
+    assert response.status_code == 200
+    data = response.json()
+    assert "❌ 错误" in data["market_data"]
+    assert "Unexpected error" in data["market_data"]
@@ -119,3 +119,19 @@ async def test_circuit_breaker_success_reset():
     result = await cb.call(mock_func)
     assert result == "success"
     assert cb.state == CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_manual_reset():
+    """Test reset closes an open circuit"""
+    cb = CircuitBreaker(failure_threshold=1, name="test-reset")
+    mock_func = AsyncMock(side_effect=[ValueError("error"), "success"])
+
+    with pytest.raises(ValueError):
+        await cb.call(mock_func)
+    assert cb.state == CircuitState.OPEN
+
+    cb.reset()
+    assert cb.state == CircuitState.CLOSED
+    assert cb.failure_count == 0
+    assert await cb.call(mock_func) == "success"
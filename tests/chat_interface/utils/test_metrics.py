@@ -80,3 +80,19 @@ def test_multiple_endpoints():
     assert all_metrics["error_count"]["endpoint2"] == 1
     assert all_metrics["request_count"]["endpoint1"] == 1
     assert all_metrics["request_count"]["endpoint2"] == 1
+
+
+def test_reset():
+    """Test reset clears all recorded metrics"""
+    metrics = Metrics()
+    metrics.start_request("endpoint1")
+    metrics.record_latency("endpoint1", 0.5)
+    metrics.record_error("endpoint1")
+
+    metrics.reset()
+    assert metrics.get_metrics() == {
+        "api_latency": {},
+        "error_count": {},
+        "request_count": {}
+    }
+    assert metrics._start_times == {}
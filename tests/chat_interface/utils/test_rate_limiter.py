@@ -1,24 +1,25 @@
+import asyncio
 import pytest
 from src.chat_interface.utils.rate_limiter import RateLimiter
 
 
 @pytest.mark.asyncio
 async def test_rate_limiter_init(rate_limiter: RateLimiter):
-    limiter = await rate_limiter
+    limiter = rate_limiter
     assert limiter.default_limit == 60
     assert limiter.default_window == 60
 
 
 @pytest.mark.asyncio
 async def test_rate_limit_not_exceeded(rate_limiter: RateLimiter):
-    limiter = await rate_limiter
+    limiter = rate_limiter
     # First request should be allowed
     assert await limiter.check_rate_limit("test") is True
 
 
 @pytest.mark.asyncio
 async def test_rate_limit_exceeded(rate_limiter: RateLimiter):
-    limiter = await rate_limiter
+    limiter = rate_limiter
     # Set a very low limit
     limit = 1
     window = 60
@@ -32,10 +33,24 @@ async def test_rate_limit_exceeded(rate_limiter: RateLimiter):
 
 @pytest.mark.asyncio
 async def test_rate_limit_different_keys(rate_limiter: RateLimiter):
-    limiter = await rate_limiter
+    limiter = rate_limiter
     limit = 1
     window = 60
 
     # Both requests should be allowed as they use different keys
     assert await limiter.check_rate_limit("test1", limit, window) is True
     assert await limiter.check_rate_limit("test2", limit, window) is True
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_same_second_burst(rate_limiter: RateLimiter):
+    limiter = rate_limiter
+    limit = 5
+    window = 60
+
+    # Requests landing in the same second must each count toward the limit
+    results = await asyncio.gather(
+        *(limiter.check_rate_limit("burst", limit, window) for _ in range(limit + 5))
+    )
+    assert results.count(True) == limit
+    assert await limiter.redis_client.zcard("rate_limit:burst") == limit
@@ -80,6 +80,7 @@ class TestWebSocketServer:
             await self.server.wait_closed()
         # Cleanup services
         try:
+            await self.model_manager.close()
             await self.redis_client.aclose()
             await self.rate_limiter.redis_client.aclose()
             await self.context_manager.redis_client.aclose()
@@ -25,9 +25,8 @@ async def test_ollama_server():
 
 async def test_content_generation():
     """Test content generation with Ollama"""
+    model_manager = AIModelManager()
     try:
-        model_manager = AIModelManager()
-        
         # Test tweet generation
         tweet = await model_manager.generate_content(
             ContentType.TWEET,
@@ -57,6 +56,8 @@ async def test_content_generation():
     except Exception as e:
         print(f"✗ Content generation test failed: {str(e)}")
         return False
+    finally:
+        await model_manager.close()
 
 async def main():
     tests = [
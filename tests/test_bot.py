@@ -13,30 +13,28 @@ async def test_ollama_server():
 @pytest.mark.asyncio
 async def test_market_content():
     """Test market update content generation"""
-    model_manager = AIModelManager(ollama_url="http://localhost:11434")
-    
-    content = await model_manager.generate_content(
-        ContentType.MARKET,
-        {
-            "price": "10.5",
-            "volume": "1M",
-            "change": "+5.2"
-        }
-    )
-    assert content is not None
-    assert any(keyword in content.lower() for keyword in ["price", "volume", "bera"])
+    async with AIModelManager(ollama_url="http://localhost:11434") as model_manager:
+        content = await model_manager.generate_content(
+            ContentType.MARKET,
+            {
+                "price": "10.5",
+                "volume": "1M",
+                "change": "+5.2"
+            }
+        )
+        assert content is not None
+        assert any(keyword in content.lower() for keyword in ["price", "volume", "bera"])
 
 @pytest.mark.asyncio
 async def test_news_content():
     """Test news content generation"""
-    model_manager = AIModelManager(ollama_url="http://localhost:11434")
-    
-    content = await model_manager.generate_content(
-        ContentType.NEWS,
-        {
-            "news": "New partnership announcement",
-            "impact": "Growing ecosystem"
-        }
-    )
-    assert content is not None
-    assert any(keyword in content.lower() for keyword in ["news", "partnership", "ecosystem"])
+    async with AIModelManager(ollama_url="http://localhost:11434") as model_manager:
+        content = await model_manager.generate_content(
+            ContentType.NEWS,
+            {
+                "news": "New partnership announcement",
+                "impact": "Growing ecosystem"
+            }
+        )
+        assert content is not None
+        assert any(keyword in content.lower() for keyword in ["news", "partnership", "ecosystem"])
@@ -0,0 +1,68 @@
+import asyncio
+import pytest
+from src.utils.cache import TTLCache, SingleFlight
+
+@pytest.fixture
+def cache():
+    return TTLCache(ttl=60)
+
+@pytest.mark.asyncio
+async def test_get_or_set_caches_result(cache):
+    """Test the factory only runs once within the TTL"""
+    calls = []
+
+    async def factory():
+        calls.append(1)
+        return {"price": 1.0}
+
+    assert await cache.get_or_set("bera", factory) == {"price": 1.0}
+    assert await cache.get_or_set("bera", factory) == {"price": 1.0}
+    assert len(calls) == 1
+
+@pytest.mark.asyncio
+async def test_none_is_not_cached(cache):
+    """Test failed fetches are retried on the next call"""
+    calls = []
+
+    async def factory():
+        calls.append(1)
+        return None
+
+    await cache.get_or_set("bera", factory)
+    await cache.get_or_set("bera", factory)
+    assert len(calls) == 2
+
+def test_expired_entry_is_dropped():
+    """Test entries are not returned after the TTL"""
+    cache = TTLCache(ttl=0)
+    cache.set("bera", 1)
+    assert cache.get("bera") is None
+
+def test_max_entries_evicts_oldest():
+    """Test the oldest entry is evicted when the cache is full"""
+    cache = TTLCache(ttl=60, max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert cache.get("c") == 3
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_concurrent_calls():
+    """Test concurrent calls for one key run the factory once"""
+    flight = SingleFlight()
+    calls = []
+
+    async def factory():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "bera"
+
+    results = await asyncio.gather(*(flight.do("price", factory) for _ in range(5)))
+    assert results == ["bera"] * 5
+    assert len(calls) == 1
+
+    # Finished calls are not reused
+    await flight.do("price", factory)
+    assert len(calls) == 2
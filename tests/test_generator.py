@@ -0,0 +1,151 @@
+import asyncio
+import pytest
+from types import SimpleNamespace
+from typing import Optional
+from src.ai_response import generator as generator_module
+from src.ai_response.generator import ContentType, ResponseGenerator
+
+class FakeResponse:
+    def __init__(self, text: str, status: int = 200, gate: Optional[asyncio.Event] = None):
+        self.status = status
+        self._text = text
+        self._gate = gate
+
+    async def json(self):
+        return {"response": self._text}
+
+    async def __aenter__(self):
+        if self._gate is not None:
+            await self._gate.wait()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+class FakeSession:
+    """Stand-in for aiohttp.ClientSession that records posted payloads"""
+    closed = False
+
+    def __init__(self, text: str = "BERA is up 🐻"):
+        self.text = text
+        self.status = 200
+        # When set, responses are held until the gate opens
+        self.gate: Optional[asyncio.Event] = None
+        self.payloads = []
+
+    def post(self, url, json):
+        self.payloads.append(json)
+        return FakeResponse(self.text, self.status, self.gate)
+
+@pytest.fixture
+def session():
+    return FakeSession()
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable monotonic clock for the response cache"""
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(
+        generator_module, "time", SimpleNamespace(monotonic=lambda: clock.now)
+    )
+    return clock
+
+@pytest.fixture
+def generator(session):
+    generator = ResponseGenerator()
+    generator._session = session
+    return generator
+
+async def test_max_length_sets_token_budget_and_truncates_at_word(generator, session):
+    """Test max_length becomes a token budget and output is cut between words"""
+    session.text = "honey " * 20
+    response = await generator.generate_response(
+        ContentType.REPLY, {"query": "hi"}, max_length=20
+    )
+
+    assert session.payloads[0]["options"] == {"num_predict": 7}
+    assert response == "honey honey honey"
+
+async def test_no_max_length_sends_no_options(generator, session):
+    """Test the model's default length applies without max_length"""
+    response = await generator.generate_response(ContentType.REPLY, {"query": "hi"})
+
+    assert "options" not in session.payloads[0]
+    assert response == "BERA is up 🐻"
+
+async def test_cache_hit_skips_upstream(generator, session, clock):
+    """Test prompts differing only in case and punctuation share a cache entry"""
+    first = await generator.generate_response(ContentType.REPLY, {"query": "Price of BERA?"})
+    second = await generator.generate_response(ContentType.REPLY, {"query": "price of bera"})
+
+    assert first == second == "BERA is up 🐻"
+    assert len(session.payloads) == 1
+
+async def test_cache_key_includes_max_length(generator, session, clock):
+    """Test a different max_length is not served from another length's entry"""
+    await generator.generate_response(ContentType.REPLY, {"query": "hi"})
+    await generator.generate_response(ContentType.REPLY, {"query": "hi"}, max_length=100)
+
+    assert len(session.payloads) == 2
+
+@pytest.mark.parametrize("content_type,context,ttl", [
+    (ContentType.MARKET, {"price": "1.23"}, 60.0),
+    (ContentType.NEWS, {"news": "mainnet"}, 300.0),
+])
+async def test_cache_expires_by_content_type(generator, session, clock, content_type, context, ttl):
+    """Test market responses expire after 60s and other types after 300s"""
+    await generator.generate_response(content_type, context)
+
+    clock.now += ttl - 1
+    await generator.generate_response(content_type, context)
+    assert len(session.payloads) == 1
+
+    clock.now += 1
+    await generator.generate_response(content_type, context)
+    assert len(session.payloads) == 2
+
+async def test_cache_evicts_least_recently_used(generator, session, clock, monkeypatch):
+    """Test the least recently used entry is evicted at capacity"""
+    monkeypatch.setattr(generator_module, "CACHE_MAX_ENTRIES", 2)
+
+    for query in ("a", "b"):
+        await generator.generate_response(ContentType.REPLY, {"query": query})
+    # Touch "a" so "b" becomes the least recently used
+    await generator.generate_response(ContentType.REPLY, {"query": "a"})
+    await generator.generate_response(ContentType.REPLY, {"query": "c"})
+    assert len(session.payloads) == 3
+
+    await generator.generate_response(ContentType.REPLY, {"query": "a"})
+    assert len(session.payloads) == 3
+    await generator.generate_response(ContentType.REPLY, {"query": "b"})
+    assert len(session.payloads) == 4
+
+async def test_concurrent_identical_prompts_share_one_call(generator, session):
+    """Test identical in-flight prompts make a single upstream call"""
+    session.gate = asyncio.Event()
+    tasks = [
+        asyncio.create_task(generator.generate_response(ContentType.REPLY, {"query": "hi"}))
+        for _ in range(5)
+    ]
+    await asyncio.sleep(0)
+    session.gate.set()
+
+    assert await asyncio.gather(*tasks) == ["BERA is up 🐻"] * 5
+    assert len(session.payloads) == 1
+
+async def test_failed_call_is_not_shared_with_later_callers(generator, session):
+    """Test callers arriving after a failed call go upstream again"""
+    session.status = 500
+    session.gate = asyncio.Event()
+    tasks = [
+        asyncio.create_task(generator.generate_response(ContentType.REPLY, {"query": "hi"}))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    session.gate.set()
+    assert await asyncio.gather(*tasks) == [""] * 3
+    assert len(session.payloads) == 1
+
+    session.status = 200
+    assert await generator.generate_response(ContentType.REPLY, {"query": "hi"}) == "BERA is up 🐻"
+    assert len(session.payloads) == 2
@@ -0,0 +1,56 @@
+import logging
+import logging.handlers
+import pytest
+from src.utils import logging_config
+from src.utils.logging_config import _parse_level, setup_logging
+
+@pytest.fixture
+def root_logger():
+    """Root logger restored to its original handlers after the test"""
+    root = logging.getLogger()
+    handlers, level = list(root.handlers), root.level
+    yield root
+    logging_config._stop_listener()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+@pytest.mark.parametrize("value,expected", [
+    ("INFO", logging.INFO),
+    ("warning", logging.WARNING),
+    (" ERROR ", logging.ERROR),
+    ("20", 20),
+    ("0", logging.NOTSET),
+])
+def test_parse_level_accepts_names_and_numbers(value, expected):
+    """Test BERA_MAX_LOG_LEVEL takes level names like the other level settings"""
+    assert _parse_level(value) == expected
+
+def test_parse_level_unknown_name_keeps_everything(caplog):
+    """Test a misspelt level name warns instead of failing the import"""
+    with caplog.at_level(logging.WARNING, logger=logging_config.__name__):
+        assert _parse_level("VERBOSE") == logging.NOTSET
+    assert "VERBOSE" in caplog.text
+
+def test_setup_logging_twice_replaces_previous_setup(root_logger, tmp_path):
+    """Test reconfiguring stops the old listener and closes its file handler"""
+    setup_logging(log_file=str(tmp_path / "first.log"))
+    first = logging_config._listener
+    first_file = next(
+        h for h in first.handlers if isinstance(h, logging.FileHandler)
+    )
+    
+    setup_logging(log_file=str(tmp_path / "second.log"))
+    
+    assert logging_config._listener is not first
+    assert first._thread is None
+    assert first_file.stream is None
+    queue_handlers = [
+        h for h in root_logger.handlers
+        if isinstance(h, logging.handlers.QueueHandler)
+    ]
+    assert len(queue_handlers) == 1
+    
+    logging.getLogger("bera.test").warning("after reconfigure")
+    logging_config._stop_listener()
+    assert "after reconfigure" in (tmp_path / "second.log").read_text()
+    assert "after reconfigure" not in (tmp_path / "first.log").read_text()
@@ -0,0 +1,69 @@
+import pytest
+from types import SimpleNamespace
+from src.news_monitoring import monitor as monitor_module
+from src.news_monitoring.monitor import NewsMonitor
+
+NEWS_HTML = """
+<section class="news-section">
+  <article>
+    <h2>Bera News</h2>
+    <time>2024-02-08</time>
+    <a href="/news/1">Read</a>
+    <p class="summary">Summary</p>
+  </article>
+</section>
+"""
+
+IDO_HTML = """
+<section class="ido-section">
+  <div class="ido-card">
+    <h3>Bera IDO</h3>
+    <time>2024-03-01</time>
+    <span class="status">Upcoming</span>
+  </div>
+</section>
+"""
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """Stand-in for requests.get that fails while `down` is set"""
+    state = SimpleNamespace(down=True, calls=0, html="")
+
+    def fake_get(url):
+        state.calls += 1
+        if state.down:
+            raise ConnectionError("upstream down")
+        return SimpleNamespace(text=state.html)
+
+    monkeypatch.setattr(monitor_module.requests, "get", fake_get)
+    return state
+
+@pytest.mark.asyncio
+async def test_news_failure_is_not_cached(upstream):
+    """Test a failed news fetch is retried upstream on the next call"""
+    monitor = NewsMonitor()
+    upstream.html = NEWS_HTML
+
+    assert await monitor.fetch_latest_news() == []
+
+    upstream.down = False
+    news = await monitor.fetch_latest_news()
+    assert upstream.calls == 2
+    assert news[0]["title"] == "Bera News"
+
+    # The recovered result is cached
+    await monitor.fetch_latest_news()
+    assert upstream.calls == 2
+
+@pytest.mark.asyncio
+async def test_ido_failure_is_not_cached(upstream):
+    """Test a failed IDO fetch is retried upstream on the next call"""
+    monitor = NewsMonitor()
+    upstream.html = IDO_HTML
+
+    assert await monitor.fetch_upcoming_idos() == []
+
+    upstream.down = False
+    idos = await monitor.fetch_upcoming_idos()
+    assert upstream.calls == 2
+    assert idos[0]["name"] == "Bera IDO"
@@ -1,7 +1,10 @@
 import pytest
 import time
 import asyncio
-from src.utils.rate_limiter import RateLimiter, RateLimit
+from dataclasses import replace
+from src.utils import rate_limiter as rate_limiter_module
+from src.utils.rate_limiter import RateLimiter, RateLimit, RateLimitStrategy
+from src.utils.errors import RateLimitError
 
 @pytest.fixture
 def rate_limiter():
@@ -21,6 +24,72 @@ async def test_rate_limiting(rate_limiter):
     elapsed = time.time() - start_time
     assert elapsed >= 1.0, "Rate limit not enforced"
 
+async def test_concurrent_acquire_does_not_overshoot(rate_limiter):
+    """Test a burst of waiters is let through only as capacity frees up"""
+    start_time = time.time()
+    await asyncio.gather(*(rate_limiter.acquire() for _ in range(4)))
+    
+    assert time.time() - start_time >= 1.0
+    assert len(rate_limiter.requests[None]) == 2
+
+async def test_acquire_after_construction_reset_passed(rate_limiter):
+    """Test waits stay positive once the construction-time reset is in the past"""
+    rate_limiter.default_limit = replace(
+        rate_limiter.default_limit, reset_time=time.time() - 5
+    )
+    start_time = time.time()
+    
+    for _ in range(3):
+        await rate_limiter.acquire()
+    
+    assert time.time() - start_time >= 0.9
+    assert len(rate_limiter.requests[None]) == 1
+
+async def test_full_window_recovers_within_retries():
+    """Test waiters get through a full window without exhausting their retries"""
+    limiter = RateLimiter(
+        default_max_requests=2,
+        default_window=1,
+        strategy=RateLimitStrategy(max_retries=1)
+    )
+    limiter.default_limit = replace(limiter.default_limit, reset_time=time.time() - 5)
+    
+    await asyncio.gather(*(limiter.acquire() for _ in range(4)))
+    
+    assert len(limiter.requests[None]) == 2
+    assert None not in limiter.retry_counts
+
+def test_try_acquire(rate_limiter):
+    """Test non-blocking acquire only succeeds while the window has capacity"""
+    assert rate_limiter.try_acquire() is True
+    assert rate_limiter.try_acquire() is True
+    
+    # Window is full, caller must fall back to acquire()
+    assert rate_limiter.try_acquire() is False
+    assert len(rate_limiter.requests[None]) == 2
+
+def test_endpoint_windows_are_separate(rate_limiter):
+    """Test requests to a limited endpoint do not count against the default"""
+    rate_limiter.endpoints["/api/tweets"] = rate_limiter.default_limit
+    assert rate_limiter.try_acquire("/api/tweets") is True
+    assert rate_limiter.try_acquire("/api/tweets") is True
+    assert rate_limiter.try_acquire("/api/tweets") is False
+    assert rate_limiter.try_acquire("/api/users") is True
+
+def test_unlimited_endpoints_share_default_window(rate_limiter):
+    """Test endpoints without their own limit draw on one default budget"""
+    assert rate_limiter.try_acquire("/api/tweets") is True
+    assert rate_limiter.try_acquire("/api/users") is True
+    assert rate_limiter.try_acquire() is False
+    assert len(rate_limiter.requests[None]) == 2
+
+async def test_retry_count_cleared_when_capacity_frees(rate_limiter):
+    """Test backoff escalation resets once a request goes through immediately"""
+    rate_limiter.endpoints["/api/tweets"] = rate_limiter.default_limit
+    rate_limiter.retry_counts["/api/tweets"] = 2
+    await rate_limiter.acquire("/api/tweets")
+    assert "/api/tweets" not in rate_limiter.retry_counts
+
 async def test_update_limits(rate_limiter):
     """Test updating rate limits from headers"""
     headers = {
@@ -33,6 +102,22 @@ async def test_update_limits(rate_limiter):
     assert rate_limiter.default_limit.max_requests == 100
     assert rate_limiter.default_limit.remaining == 50
 
+def test_update_limits_skips_unchanged_headers(rate_limiter):
+    """Test repeated identical headers keep the already-parsed limit"""
+    headers = {
+        "x-rate-limit-remaining": "50",
+        "x-rate-limit-reset": str(int(time.time()) + 3600),
+        "x-rate-limit-limit": "100"
+    }
+    
+    rate_limiter.update_limits(headers)
+    limit = rate_limiter.default_limit
+    rate_limiter.update_limits(dict(headers))
+    assert rate_limiter.default_limit is limit
+    
+    rate_limiter.update_limits({**headers, "x-rate-limit-remaining": "49"})
+    assert rate_limiter.default_limit.remaining == 49
+
 async def test_handle_429(rate_limiter):
     """Test handling 429 responses"""
     wait_time = rate_limiter.handle_429(retry_after="30")
@@ -54,3 +139,32 @@ async def test_endpoint_specific_limits(rate_limiter):
     assert "/api/tweets" in rate_limiter.endpoints
     assert rate_limiter.endpoints["/api/tweets"].max_requests == 20
     assert rate_limiter.endpoints["/api/tweets"].remaining == 10
+
+async def test_strategy_backoff_jitter():
+    """Test backoff never waits less than retry_after and stays capped"""
+    strategy = RateLimitStrategy()
+    for retry_count in range(strategy.max_retries):
+        wait_time = await strategy.handle_rate_limit(retry_count, retry_after=10)
+        assert 10 <= wait_time <= min(10 * 3 * 2 ** retry_count, 3600)
+    
+    with pytest.raises(RateLimitError):
+        await strategy.handle_rate_limit(strategy.max_retries)
+
+async def test_fast_path_does_not_jump_queued_waiters(rate_limiter):
+    """Test a new caller queues behind a waiter instead of taking a freed slot"""
+    lock = rate_limiter._waiters[None]
+    await lock.acquire()
+    
+    caller = asyncio.create_task(rate_limiter.acquire())
+    await asyncio.sleep(0)
+    assert not caller.done()
+    assert len(rate_limiter.requests[None]) == 0
+    
+    lock.release()
+    await caller
+    assert len(rate_limiter.requests[None]) == 1
+
+def test_logger_attribute_kept(rate_limiter):
+    """Test instances still expose the shared module logger"""
+    assert rate_limiter.logger is rate_limiter_module.logger
+    assert rate_limiter.strategy.logger is rate_limiter_module.logger